@@ -11,7 +11,7 @@ from django.utils import timezone
 from django.conf import settings
 from django.db import transaction
 from .models import CustomUser, UserProfile, UserActivity
-from .services.email_service import EmailService
+from .services.email_service import get_email_service
 import secrets
 import hashlib
 import re
@@ -25,7 +25,7 @@ class AuthenticationService:
     """Comprehensive authentication service for AfriMail Pro"""
     
     def __init__(self):
-        self.email_service = EmailService()
+        self.email_service = get_email_service()
     
     def register_user(self, user_data, request=None):
         """Register new user with comprehensive validation"""
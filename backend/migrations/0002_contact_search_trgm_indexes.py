@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:12
+
+import backend.models.indexes
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='contact',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('email', models.TextField())), name='gin_trgm_ops'), name='contacts_email_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('first_name', models.TextField())), name='gin_trgm_ops'), name='contacts_first_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('last_name', models.TextField())), name='gin_trgm_ops'), name='contacts_last_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('company', models.TextField())), name='gin_trgm_ops'), name='contacts_company_trgm'),
+        ),
+    ]
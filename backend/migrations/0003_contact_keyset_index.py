@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0002_contact_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='contacts_user_id_75b45e_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0003_contact_keyset_index'),
+    ]
+
+    # Contact.lists uses an auto-created through model, which cannot declare
+    # Meta.indexes, so the (contactlist_id, contact_id) index is plain SQL.
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX contacts_lists_list_contact_idx ON contacts_lists (contactlist_id, contact_id);',
+            reverse_sql='DROP INDEX contacts_lists_list_contact_idx;',
+        ),
+    ]
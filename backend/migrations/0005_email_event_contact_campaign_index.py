@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0004_contacts_lists_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailevent',
+            index=models.Index(fields=['contact', 'campaign'], name='email_event_contact_c705c1_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0005_email_event_contact_campaign_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='contacts_user_id_4b960f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'is_active', '-created_at', '-id'], name='contacts_user_id_7ab836_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'country'], name='contacts_user_id_522cf2_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0006_contact_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='emailevent',
+            name='email_event_campaig_9b82e7_idx',
+        ),
+        migrations.AddIndex(
+            model_name='emailevent',
+            index=models.Index(fields=['campaign', 'event_type', 'created_at'], name='email_event_campaig_3a2634_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:23
+
+import backend.models.indexes
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.comparison
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0007_email_event_campaign_type_created_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emailcampaign',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('name', models.TextField())), name='gin_trgm_ops'), name='email_campaigns_name_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='emailcampaign',
+            index=backend.models.indexes.TrigramIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper(django.db.models.functions.comparison.Cast('subject', models.TextField())), name='gin_trgm_ops'), name='email_campaigns_subject_trgm'),
+        ),
+    ]
@@ -0,0 +1,103 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:24
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+from datetime import timedelta
+
+BATCH_SIZE = 200
+
+
+def backfill_notifications(apps, schema_editor):
+    """Create notifications for campaigns and domains that existed before the table"""
+    EmailCampaign = apps.get_model('backend', 'EmailCampaign')
+    EmailDomainConfig = apps.get_model('backend', 'EmailDomainConfig')
+    UserNotification = apps.get_model('backend', 'UserNotification')
+    
+    week_ago = django.utils.timezone.now() - timedelta(days=7)
+    campaign_fields = ('id', 'user_id', 'name', 'emails_sent', 'completed_at', 'updated_at')
+    notifications = []
+    
+    def flush(force=False):
+        if notifications and (force or len(notifications) >= BATCH_SIZE):
+            UserNotification.objects.bulk_create(notifications)
+            notifications.clear()
+    
+    completed = EmailCampaign.objects.filter(status='SENT', completed_at__gte=week_ago).only(*campaign_fields)
+    for campaign in completed.iterator(chunk_size=BATCH_SIZE):
+        notifications.append(UserNotification(
+            user_id=campaign.user_id,
+            key=f'campaign:{campaign.pk}',
+            type='success',
+            title='Campaign Completed',
+            message=f'Your campaign "{campaign.name}" has been sent to {campaign.emails_sent} recipients.',
+            action_url=f'/campaigns/{campaign.id}/',
+            timestamp=campaign.completed_at,
+            expires_at=campaign.completed_at + timedelta(days=7),
+        ))
+        flush()
+    
+    failed = EmailCampaign.objects.filter(status='FAILED', updated_at__gte=week_ago).only(*campaign_fields)
+    for campaign in failed.iterator(chunk_size=BATCH_SIZE):
+        notifications.append(UserNotification(
+            user_id=campaign.user_id,
+            key=f'campaign:{campaign.pk}',
+            type='error',
+            title='Campaign Failed',
+            message=f'Your campaign "{campaign.name}" failed to send. Please check your email configuration.',
+            action_url=f'/campaigns/{campaign.id}/',
+            timestamp=campaign.updated_at,
+            expires_at=campaign.updated_at + timedelta(days=7),
+        ))
+        flush()
+    
+    pending = EmailDomainConfig.objects.filter(domain_verified=False, is_active=True).only(
+        'id', 'user_id', 'domain_name', 'created_at'
+    )
+    for domain in pending.iterator(chunk_size=BATCH_SIZE):
+        notifications.append(UserNotification(
+            user_id=domain.user_id,
+            key=f'domain:{domain.pk}',
+            type='warning',
+            title='Domain Verification Pending',
+            message=f'Please verify your domain "{domain.domain_name}" to start sending emails.',
+            action_url=f'/email-config/{domain.id}/verify/',
+            timestamp=domain.created_at,
+        ))
+        flush()
+    
+    flush(force=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0008_email_campaign_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserNotification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=100)),
+                ('type', models.CharField(choices=[('success', 'Success'), ('error', 'Error'), ('warning', 'Warning'), ('info', 'Info')], default='info', max_length=20)),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('action_url', models.CharField(blank=True, max_length=500)),
+                ('timestamp', models.DateTimeField(default=django.utils.timezone.now)),
+                ('expires_at', models.DateTimeField(blank=True, null=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User Notification',
+                'verbose_name_plural': 'User Notifications',
+                'db_table': 'user_notifications',
+                'ordering': ['-timestamp'],
+                'indexes': [models.Index(fields=['user', '-timestamp'], name='user_notifi_user_id_34d601_idx')],
+                'unique_together': {('user', 'key')},
+            },
+        ),
+        migrations.RunPython(backfill_notifications, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('backend', '0009_user_notifications'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailevent',
+            name='user',
+            field=models.ForeignKey(db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='email_events', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
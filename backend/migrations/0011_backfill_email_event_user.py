@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:28
+
+from django.db import migrations, models
+
+
+def backfill_event_user(apps, schema_editor):
+    """Copy the owning user of each event's campaign onto the event"""
+    EmailEvent = apps.get_model('backend', 'EmailEvent')
+    EmailCampaign = apps.get_model('backend', 'EmailCampaign')
+
+    EmailEvent.objects.filter(user__isnull=True).update(
+        user_id=models.Subquery(
+            EmailCampaign.objects.filter(pk=models.OuterRef('campaign_id')).values('user_id')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    # Runs in its own transaction so the deferred FK checks of the UPDATE
+    # are resolved before 0012 alters the column
+    dependencies = [
+        ('backend', '0010_email_event_user'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_event_user, migrations.RunPython.noop),
+    ]
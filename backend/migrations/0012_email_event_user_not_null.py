@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:28
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0011_backfill_email_event_user'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailevent',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='email_events', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='emailevent',
+            index=models.Index(fields=['user', 'event_type', 'created_at'], name='email_event_user_id_c1a578_idx'),
+        ),
+    ]
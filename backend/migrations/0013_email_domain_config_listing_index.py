@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0012_email_event_user_not_null'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='emaildomainconfig',
+            name='email_domai_user_id_fbffc9_idx',
+        ),
+        migrations.AddIndex(
+            model_name='emaildomainconfig',
+            index=models.Index(fields=['user', 'is_active', '-created_at'], name='email_domai_user_id_191f50_idx'),
+        ),
+    ]
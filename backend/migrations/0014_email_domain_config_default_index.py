@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('backend', '0013_email_domain_config_listing_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='emaildomainconfig',
+            index=models.Index(condition=models.Q(('is_default', True)), fields=['user'], name='emailcfg_default_partial'),
+        ),
+    ]
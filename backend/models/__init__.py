@@ -1,6 +1,6 @@
 # backend/models/__init__.py
 
-from .user_models import CustomUser, UserProfile, UserActivity
+from .user_models import CustomUser, UserProfile, UserActivity, UserNotification
 from .contact_models import Contact, ContactList, ContactTag, ContactImport
 from .email_models import EmailDomainConfig, EmailTemplate, EmailCampaign, EmailQueue
 from .analytics_models import (
@@ -10,7 +10,7 @@ from .analytics_models import (
 
 __all__ = [
     # User models
-    'CustomUser', 'UserProfile', 'UserActivity',
+    'CustomUser', 'UserProfile', 'UserActivity', 'UserNotification',
     
     # Contact models
     'Contact', 'ContactList', 'ContactTag', 'ContactImport',
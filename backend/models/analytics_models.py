@@ -35,6 +35,9 @@ class EmailEvent(models.Model):
     campaign = models.ForeignKey(EmailCampaign, on_delete=models.CASCADE, related_name='events')
     contact = models.ForeignKey(Contact, on_delete=models.CASCADE, related_name='email_events')
     
+    # Denormalized from campaign.user so per-user event queries skip the join
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='email_events', db_index=False)
+    
     # Event Details
     event_type = models.CharField(max_length=20, choices=EVENT_TYPES)
     event_data = models.JSONField(default=dict, blank=True)
@@ -63,8 +66,10 @@ class EmailEvent(models.Model):
         verbose_name_plural = 'Email Events'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['campaign', 'event_type']),
+            models.Index(fields=['user', 'event_type', 'created_at']),
+            models.Index(fields=['campaign', 'event_type', 'created_at']),
             models.Index(fields=['contact', 'event_type']),
+            models.Index(fields=['contact', 'campaign']),
             models.Index(fields=['event_type', 'created_at']),
             models.Index(fields=['created_at']),
         ]
@@ -72,12 +77,19 @@ class EmailEvent(models.Model):
     def __str__(self):
         return f"{self.event_type} - {self.contact.email} - {self.campaign.name}"
     
+    def save(self, *args, **kwargs):
+        # Copy the owner from an already loaded campaign; otherwise callers must pass user
+        if self.user_id is None and self._meta.get_field('campaign').is_cached(self):
+            self.user_id = self.campaign.user_id
+        super().save(*args, **kwargs)
+    
     @classmethod
     def log_event(cls, campaign, contact, event_type, **kwargs):
         """Log an email event"""
         return cls.objects.create(
             campaign=campaign,
             contact=contact,
+            user_id=campaign.user_id,
             event_type=event_type,
             event_data=kwargs.get('event_data', {}),
             ip_address=kwargs.get('ip_address'),
@@ -1,10 +1,13 @@
 # backend/models/contact_models.py
 
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.core.validators import validate_email
 from django.utils import timezone
 from taggit.managers import TaggableManager
 from .user_models import CustomUser
+from .indexes import icontains_trigram_index
 import uuid
 import json
 
@@ -61,6 +64,22 @@ class ContactList(models.Model):
         self.contact_count = self.contacts.filter(is_active=True).count()
         self.save(update_fields=['contact_count'])
     
+    @classmethod
+    def recompute_counts(cls, list_ids):
+        """Recompute contact counts for several lists in a single UPDATE"""
+        list_ids = set(list_ids)
+        if not list_ids:
+            return 0
+        
+        active_counts = Contact.objects.filter(
+            lists=OuterRef('pk'),
+            is_active=True
+        ).order_by().values('lists').annotate(c=Count('id')).values('c')
+        
+        return cls.objects.filter(id__in=list_ids).update(
+            contact_count=Coalesce(Subquery(active_counts), Value(0))
+        )
+    
     def add_contact(self, contact):
         """Add contact to this list"""
         contact.lists.add(self)
@@ -183,9 +202,18 @@ class Contact(models.Model):
         indexes = [
             models.Index(fields=['user', 'email']),
             models.Index(fields=['user', 'status']),
-            models.Index(fields=['user', 'is_active']),
+            # Active contact listing ordered newest first
+            models.Index(fields=['user', 'is_active', '-created_at', '-id']),
+            models.Index(fields=['user', 'country']),
             models.Index(fields=['engagement_score']),
             models.Index(fields=['created_at']),
+            # Keyset pagination on (-created_at, -id)
+            models.Index(fields=['user', '-created_at', '-id']),
+            # Back the ContactListView search filters
+            icontains_trigram_index('email', name='contacts_email_trgm'),
+            icontains_trigram_index('first_name', name='contacts_first_name_trgm'),
+            icontains_trigram_index('last_name', name='contacts_last_name_trgm'),
+            icontains_trigram_index('company', name='contacts_company_trgm'),
         ]
     
     def __str__(self):
@@ -365,13 +393,17 @@ class ContactImport(models.Model):
         self.completed_at = timezone.now()
         self.save(update_fields=['status', 'error_message', 'completed_at'])
     
-    def add_error(self, row_number, error_message):
-        """Add an import error"""
+    def record_error(self, row_number, error_message):
+        """Add an import error without saving, so a batch of errors is written once"""
         self.errors.append({
             'row': row_number,
             'error': error_message,
             'timestamp': timezone.now().isoformat()
         })
+    
+    def add_error(self, row_number, error_message):
+        """Add an import error"""
+        self.record_error(row_number, error_message)
         self.save(update_fields=['errors'])
     
     @property
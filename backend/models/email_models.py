@@ -5,6 +5,7 @@ from django.core.validators import validate_email
 from django.utils import timezone
 from .user_models import CustomUser
 from .contact_models import ContactList
+from .indexes import icontains_trigram_index
 import uuid
 import json
 
@@ -84,7 +85,10 @@ class EmailDomainConfig(models.Model):
         unique_together = ['user', 'domain_name']
         ordering = ['-is_default', '-created_at']
         indexes = [
-            models.Index(fields=['user', 'is_active']),
+            models.Index(fields=['user', 'is_active', '-created_at']),
+            models.Index(
+                fields=['user'], condition=models.Q(is_default=True), name='emailcfg_default_partial'
+            ),
             models.Index(fields=['domain_verified']),
             models.Index(fields=['smtp_provider']),
         ]
@@ -94,7 +98,8 @@ class EmailDomainConfig(models.Model):
     
     def save(self, *args, **kwargs):
         # Ensure only one default config per user
-        if self.is_default:
+        update_fields = kwargs.get('update_fields')
+        if self.is_default and (update_fields is None or 'is_default' in update_fields):
             EmailDomainConfig.objects.filter(
                 user=self.user, is_default=True
             ).exclude(pk=self.pk).update(is_default=False)
@@ -308,11 +313,34 @@ class EmailCampaign(models.Model):
             models.Index(fields=['user', 'status']),
             models.Index(fields=['scheduled_at']),
             models.Index(fields=['created_at']),
+            # Back the SearchView campaign filters
+            icontains_trigram_index('name', name='email_campaigns_name_trgm'),
+            icontains_trigram_index('subject', name='email_campaigns_subject_trgm'),
         ]
     
     def __str__(self):
         return f"{self.name} - {self.status}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so signals can tell when it changes
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
+    def status_changed(self):
+        """Check if status differs from the value last loaded or saved"""
+        return getattr(self, '_loaded_status', None) != self.status
+    
+    @staticmethod
+    def rate_expression(count_field, total_field='emails_delivered'):
+        """SQL expression for a percentage rate, matching the rate properties below"""
+        return models.Case(
+            models.When(**{total_field: 0}, then=models.Value(0.0)),
+            default=models.F(count_field) * 100.0 / models.F(total_field),
+            output_field=models.FloatField()
+        )
+    
     @property
     def open_rate(self):
         """Calculate open rate"""
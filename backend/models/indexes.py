@@ -0,0 +1,36 @@
+# backend/models/indexes.py
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models
+from django.db.models.functions import Cast, Upper
+
+
+class TrigramIndex(GinIndex):
+    """
+    GIN trigram index for ``__icontains`` searches.
+
+    GIN and pg_trgm only exist on PostgreSQL; other backends (SQLite in
+    development) get a plain expression index with the operator class
+    stripped so the same model state migrates everywhere.
+    """
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+        expressions = [
+            expression.get_source_expressions()[0] if isinstance(expression, OpClass) else expression
+            for expression in self.expressions
+        ]
+        return models.Index(*expressions, name=self.name).create_sql(model, schema_editor, **kwargs)
+
+
+def icontains_trigram_index(field_name, name):
+    """
+    Trigram index on ``UPPER(field::text)``, the exact expression Django
+    compiles ``field__icontains`` to on PostgreSQL.
+    """
+    return TrigramIndex(
+        OpClass(Upper(Cast(field_name, models.TextField())), name='gin_trgm_ops'),
+        name=name,
+    )
@@ -4,8 +4,10 @@
 
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.db.models import Exists, OuterRef
 from django.core.validators import validate_email
 from django.utils import timezone
+from django.utils.functional import cached_property
 import uuid
 from datetime import timedelta
 
@@ -141,6 +143,28 @@ class CustomUser(AbstractUser):
             return '/admin-panel/'
         return '/dashboard/'
     
+    @cached_property
+    def setup_flags(self):
+        """Account setup flags, checked once per user instance with EXISTS subqueries"""
+        domains = self.email_domains.model.objects.filter(user=OuterRef('pk'), is_active=True)
+        flags = CustomUser.objects.filter(pk=self.pk).annotate(
+            email_config_added=Exists(domains),
+            domain_verified=Exists(domains.filter(domain_verified=True)),
+            contacts_added=Exists(self.contacts.model.objects.filter(
+                user=OuterRef('pk'), is_active=True
+            )),
+            first_campaign_sent=Exists(self.email_campaigns.model.objects.filter(
+                user=OuterRef('pk'), status='SENT'
+            )),
+        ).values(
+            'email_config_added', 'domain_verified', 'contacts_added', 'first_campaign_sent'
+        ).get()
+        
+        return {
+            'profile_completed': bool(self.first_name and self.last_name and self.company),
+            **flags,
+        }
+    
     def generate_email_verification_token(self):
         """Generate and set email verification token"""
         import secrets
@@ -315,4 +339,109 @@ class UserActivity(models.Model):
             ip = x_forwarded_for.split(',')[0]
         else:
             ip = request.META.get('REMOTE_ADDR')
-        return ip
\ No newline at end of file
+        return ip
+
+class UserNotification(models.Model):
+    """
+    Denormalized user notifications, kept up to date by signals
+    """
+    
+    NOTIFICATION_TYPES = [
+        ('success', 'Success'),
+        ('error', 'Error'),
+        ('warning', 'Warning'),
+        ('info', 'Info'),
+    ]
+    
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='notifications')
+    
+    # Source object, e.g. "campaign:<id>", so each source has at most one notification
+    key = models.CharField(max_length=100)
+    
+    # Notification Content
+    type = models.CharField(max_length=20, choices=NOTIFICATION_TYPES, default='info')
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    action_url = models.CharField(max_length=500, blank=True)
+    
+    # Timestamps
+    timestamp = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        db_table = 'user_notifications'
+        verbose_name = 'User Notification'
+        verbose_name_plural = 'User Notifications'
+        ordering = ['-timestamp']
+        unique_together = ['user', 'key']
+        indexes = [
+            models.Index(fields=['user', '-timestamp']),
+        ]
+    
+    def __str__(self):
+        return f"{self.user.email} - {self.title}"
+    
+    @classmethod
+    def active_for(cls, user, now=None):
+        """Notifications for a user that have not expired"""
+        now = now or timezone.now()
+        return cls.objects.filter(
+            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=now),
+            user=user
+        )
+    
+    @classmethod
+    def clear(cls, user_id, key):
+        """Remove the notification for a source object"""
+        cls.objects.filter(user_id=user_id, key=key).delete()
+    
+    @classmethod
+    def sync_campaign(cls, campaign):
+        """
+        Create, update or clear the notification for a campaign's status.
+        
+        Called by a post_save signal; code changing status with QuerySet.update()
+        must call this itself.
+        """
+        key = f'campaign:{campaign.pk}'
+        
+        if campaign.status == 'SENT':
+            timestamp = campaign.completed_at or campaign.updated_at
+            defaults = {
+                'type': 'success',
+                'title': 'Campaign Completed',
+                'message': f'Your campaign "{campaign.name}" has been sent to {campaign.emails_sent} recipients.',
+            }
+        elif campaign.status == 'FAILED':
+            timestamp = campaign.updated_at
+            defaults = {
+                'type': 'error',
+                'title': 'Campaign Failed',
+                'message': f'Your campaign "{campaign.name}" failed to send. Please check your email configuration.',
+            }
+        else:
+            cls.clear(campaign.user_id, key)
+            return
+        
+        defaults.update({
+            'timestamp': timestamp,
+            'expires_at': timestamp + timedelta(days=7),
+            'action_url': f'/campaigns/{campaign.id}/',
+        })
+        cls.objects.update_or_create(user_id=campaign.user_id, key=key, defaults=defaults)
+    
+    @classmethod
+    def sync_domain(cls, domain):
+        """Create or clear the verification reminder for an email domain"""
+        key = f'domain:{domain.pk}'
+        
+        if domain.is_active and not domain.domain_verified:
+            cls.objects.get_or_create(user_id=domain.user_id, key=key, defaults={
+                'type': 'warning',
+                'title': 'Domain Verification Pending',
+                'message': f'Please verify your domain "{domain.domain_name}" to start sending emails.',
+                'timestamp': domain.created_at,
+                'action_url': f'/email-config/{domain.id}/verify/',
+            })
+        else:
+            cls.clear(domain.user_id, key)
@@ -0,0 +1,188 @@
+# backend/pagination.py
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from math import ceil
+import base64
+import binascii
+
+
+class KeysetPage:
+    """
+    A single page of keyset ("seek") pagination results.
+
+    Provides the parts of Django's ``Page`` used by the list templates.
+    ``previous_cursor`` and ``next_cursor`` are the ``before`` and ``after``
+    values linking to the neighbouring pages.
+    """
+
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_previous = has_previous
+        self._has_next = has_next
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    @property
+    def next_cursor(self):
+        if not (self.has_next() and self.object_list):
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1])
+
+    @property
+    def previous_cursor(self):
+        if not (self.has_previous() and self.object_list):
+            return None
+        return self.paginator.encode_cursor(self.object_list[0])
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset ordered by ``(-<field>, -pk)`` by seeking past a cursor.
+
+    Each page is fetched with ``LIMIT per_page + 1`` after (or before) a row of
+    the neighbouring page, so deep pages cost the same as the first one.
+    ``count``, ``num_pages`` and ``page_range`` run a COUNT only when used.
+    """
+
+    def __init__(self, object_list, per_page, field='created_at'):
+        self.object_list = object_list.order_by(f'-{field}', '-pk')
+        self.per_page = int(per_page)
+        self.field = field
+
+    @cached_property
+    def count(self):
+        return self.object_list.count()
+
+    @property
+    def num_pages(self):
+        return max(ceil(self.count / self.per_page), 1)
+
+    @property
+    def page_range(self):
+        return range(1, self.num_pages + 1)
+
+    def encode_cursor(self, obj):
+        value = f"{getattr(obj, self.field).isoformat()}|{obj.pk}"
+        return base64.urlsafe_b64encode(value.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        """Return ``(value, pk)`` for a cursor, or ``None`` if it is invalid"""
+        try:
+            value, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split('|', 1)
+        except (binascii.Error, UnicodeError, ValueError):
+            return None
+
+        try:
+            value = parse_datetime(value)
+            pk = self.object_list.model._meta.pk.to_python(pk)
+        except (ValueError, ValidationError):
+            return None
+        if value is None:
+            return None
+        return value, pk
+
+    def get_page(self, after=None, before=None, number=None):
+        """
+        Return the page after or before a cursor.
+
+        ``number`` is the page number carried along with the cursor for display.
+        Without a valid cursor, ``number`` is served with OFFSET so plain
+        ``?page=`` links keep working; invalid input gives the first page.
+        """
+        try:
+            number = max(int(number), 1)
+        except (TypeError, ValueError):
+            number = 1
+
+        position = self.decode_cursor(after) if after else None
+        if position:
+            value, pk = position
+            rows = list(self.object_list.filter(
+                Q(**{f'{self.field}__lt': value}) |
+                Q(**{self.field: value, 'pk__lt': pk})
+            )[:self.per_page + 1])
+            return KeysetPage(rows[:self.per_page], max(number, 2), self, True, len(rows) > self.per_page)
+
+        position = self.decode_cursor(before) if before else None
+        if position:
+            value, pk = position
+            rows = list(self.object_list.filter(
+                Q(**{f'{self.field}__gt': value}) |
+                Q(**{self.field: value, 'pk__gt': pk})
+            ).reverse()[:self.per_page + 1])
+            has_previous = len(rows) > self.per_page
+            number = max(number, 2) if has_previous else 1
+            return KeysetPage(rows[:self.per_page][::-1], number, self, has_previous, True)
+
+        if number > 1:
+            number = min(number, self.num_pages)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        return KeysetPage(rows[:self.per_page], number, self, number > 1, len(rows) > self.per_page)
+
+
+class PKPaginator(Paginator):
+    """
+    Paginator that applies OFFSET/LIMIT to a primary key subquery.
+
+    The database walks the offset over ``pk`` values only and then loads the
+    full columns for the rows on the requested page.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        page_pks = self.object_list.values('pk')[bottom:top]
+        return self._get_page(self.object_list.filter(pk__in=page_pks), number, self)
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin replacing OFFSET/LIMIT pagination with keyset pagination.
+
+    Cursors are read from the ``after`` and ``before`` query parameters and the
+    displayed page number from ``page``.
+    """
+
+    cursor_kwarg = 'after'
+    previous_cursor_kwarg = 'before'
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size)
+        page = paginator.get_page(
+            self.request.GET.get(self.cursor_kwarg),
+            self.request.GET.get(self.previous_cursor_kwarg),
+            self.request.GET.get(self.page_kwarg)
+        )
+        return (paginator, page, page.object_list, page.has_other_pages())
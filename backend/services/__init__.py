@@ -1,9 +1,9 @@
 # backend/services/__init__.py
 
-from .email_service import EmailService
+from .email_service import EmailService, get_email_service
 from .campaign_service import CampaignService
 from .contact_service import ContactService
 from .analytics_service import AnalyticsService
 
-__all__ = ['EmailService', 'CampaignService', 'ContactService', 'AnalyticsService']
+__all__ = ['EmailService', 'get_email_service', 'CampaignService', 'ContactService', 'AnalyticsService']
 
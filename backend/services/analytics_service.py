@@ -44,7 +44,7 @@ class AnalyticsService:
         )
         
         events = EmailEvent.objects.filter(
-            campaign__user=user,
+            user=user,
             created_at__range=[start_date, end_date]
         )
         
@@ -97,7 +97,7 @@ class AnalyticsService:
             date_obj = timezone.now().date() - timedelta(days=i)
             
             events = EmailEvent.objects.filter(
-                campaign__user=user,
+                user=user,
                 created_at__date=date_obj
             )
             
@@ -4,7 +4,7 @@ from django.utils import timezone
 from django.db import transaction
 from django.db.models import Q, Count, Avg
 from ..models import EmailCampaign, Contact, EmailEvent, EmailQueue, CampaignAnalytics
-from .email_service import EmailService
+from .email_service import get_email_service
 import logging
 from datetime import timedelta
 
@@ -15,7 +15,7 @@ class CampaignService:
     """Service for managing email campaigns"""
     
     def __init__(self):
-        self.email_service = EmailService()
+        self.email_service = get_email_service()
     
     def create_campaign(self, user, campaign_data):
         """Create a new campaign"""
@@ -3,7 +3,10 @@
 
 import csv
 import io
+import tempfile
 import pandas as pd
+from openpyxl import Workbook
+from django.core.files.storage import default_storage
 from django.db import transaction
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
@@ -14,6 +17,13 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output"""
+    
+    def write(self, value):
+        return value
+
+
 class ContactService:
     """Service for managing contacts"""
     
@@ -28,8 +38,7 @@ class ContactService:
                 contact = Contact.objects.create(user=user, **contact_data)
                 
                 # Update contact lists counts
-                for contact_list in contact.lists.all():
-                    contact_list.update_contact_count()
+                ContactList.recompute_counts(contact.lists.values_list('id', flat=True))
                 
                 logger.info(f"Contact created: {contact.email} by {user.email}")
                 return {'success': True, 'contact': contact}
@@ -42,7 +51,7 @@ class ContactService:
         """Update an existing contact"""
         try:
             with transaction.atomic():
-                old_lists = set(contact.lists.all())
+                old_list_ids = set(contact.lists.values_list('id', flat=True))
                 
                 # Update contact fields
                 for field, value in contact_data.items():
@@ -52,11 +61,8 @@ class ContactService:
                 contact.save()
                 
                 # Update list counts if lists changed
-                new_lists = set(contact.lists.all())
-                changed_lists = old_lists.union(new_lists)
-                
-                for contact_list in changed_lists:
-                    contact_list.update_contact_count()
+                new_list_ids = set(contact.lists.values_list('id', flat=True))
+                ContactList.recompute_counts(old_list_ids | new_list_ids)
                 
                 logger.info(f"Contact updated: {contact.email}")
                 return {'success': True, 'contact': contact}
@@ -69,14 +75,13 @@ class ContactService:
         """Delete a contact"""
         try:
             with transaction.atomic():
-                contact_lists = list(contact.lists.all())
+                contact_list_ids = list(contact.lists.values_list('id', flat=True))
                 email = contact.email
                 
                 contact.delete()
                 
                 # Update list counts
-                for contact_list in contact_lists:
-                    contact_list.update_contact_count()
+                ContactList.recompute_counts(contact_list_ids)
                 
                 logger.info(f"Contact deleted: {email}")
                 return {'success': True}
@@ -86,7 +91,9 @@ class ContactService:
             return {'success': False, 'error': str(e)}
     
     def import_contacts_from_file(self, user, file, options=None):
-        """Import contacts from CSV/Excel file"""
+        """Store an uploaded CSV/Excel file and queue it for import"""
+        from ..tasks import process_contact_import
+        
         options = options or {}
         skip_duplicates = options.get('skip_duplicates', True)
         update_existing = options.get('update_existing', False)
@@ -97,38 +104,54 @@ class ContactService:
             import_record = ContactImport.objects.create(
                 user=user,
                 file_name=file.name,
-                file_path=f"imports/{file.name}",
+                file_path='',
                 target_list=target_list
             )
+            import_record.file_path = default_storage.save(
+                f"imports/{import_record.id}_{file.name}", file
+            )
+            import_record.save(update_fields=['file_path'])
             
-            # Process file
-            try:
-                contacts_data = self._parse_contact_file(file)
-                import_record.total_rows = len(contacts_data)
-                import_record.save()
-                
-                # Process contacts
-                result = self._process_contact_import(
-                    user, contacts_data, import_record, options
-                )
-                
-                import_record.mark_completed()
-                
-                logger.info(f"Contact import completed: {result['successful']} successful, {result['failed']} failed")
-                return {
-                    'success': True,
-                    'import_id': import_record.id,
-                    'result': result
-                }
-                
-            except Exception as e:
-                import_record.mark_failed(str(e))
-                raise e
+            # Parse and insert rows in the background
+            process_contact_import.delay(str(import_record.id), {
+                'skip_duplicates': skip_duplicates,
+                'update_existing': update_existing,
+            })
+            
+            return {'success': True, 'import_id': import_record.id}
                 
         except Exception as e:
             logger.error(f"Contact import error: {str(e)}")
             return {'success': False, 'error': str(e)}
     
+    def process_contact_import(self, import_record, options=None):
+        """Parse a stored import file and create its contacts"""
+        options = dict(options or {}, target_list=import_record.target_list)
+        
+        try:
+            import_record.status = 'PROCESSING'
+            import_record.save(update_fields=['status'])
+            
+            with default_storage.open(import_record.file_path, 'rb') as file:
+                contacts_data = self._parse_contact_file(file)
+            import_record.total_rows = len(contacts_data)
+            import_record.save(update_fields=['total_rows'])
+            
+            # Process contacts
+            result = self._process_contact_import(
+                import_record.user, contacts_data, import_record, options
+            )
+            
+            import_record.mark_completed()
+            
+            logger.info(f"Contact import completed: {result['successful']} successful, {result['failed']} failed")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Contact import error: {str(e)}")
+            import_record.mark_failed(str(e))
+            raise e
+    
     def _parse_contact_file(self, file):
         """Parse contact file (CSV or Excel)"""
         file_extension = file.name.lower().split('.')[-1]
@@ -188,7 +211,7 @@ class ContactService:
         except Exception as e:
             raise ValueError(f'Error parsing Excel file: {str(e)}')
     
-    def _process_contact_import(self, user, contacts_data, import_record, options):
+    def _process_contact_import(self, user, contacts_data, import_record, options, batch_size=1000):
         """Process contact import data"""
         successful = 0
         failed = 0
@@ -206,66 +229,96 @@ class ContactService:
             'country': ['country', 'nation'],
             'website': ['website', 'url', 'web_site'],
         }
+        target_list = options.get('target_list')
+        seen_emails = set()
         
-        for row_num, row_data in enumerate(contacts_data, start=1):
-            try:
+        for start in range(0, len(contacts_data), batch_size):
+            batch = []
+            for row_num, row_data in enumerate(contacts_data[start:start + batch_size], start=start + 1):
                 # Map fields
                 contact_data = self._map_contact_fields(row_data, field_mapping)
                 
                 # Validate email
                 if not contact_data.get('email'):
-                    import_record.add_error(row_num, 'Missing email address')
+                    import_record.record_error(row_num, 'Missing email address')
                     failed += 1
                     continue
                 
                 try:
                     validate_email(contact_data['email'])
                 except ValidationError:
-                    import_record.add_error(row_num, 'Invalid email address')
+                    import_record.record_error(row_num, 'Invalid email address')
                     failed += 1
                     continue
                 
-                # Check for duplicates
-                existing_contact = Contact.objects.filter(
+                batch.append((row_num, contact_data))
+            
+            # Check for duplicates in one query per batch
+            existing_contacts = {
+                contact.email: contact for contact in Contact.objects.filter(
                     user=user,
-                    email=contact_data['email']
-                ).first()
+                    email__in=[contact_data['email'] for _, contact_data in batch]
+                )
+            }
+            
+            new_contacts = []
+            for row_num, contact_data in batch:
+                existing_contact = existing_contacts.get(contact_data['email'])
                 
-                if existing_contact:
+                if existing_contact or contact_data['email'] in seen_emails:
                     if options.get('skip_duplicates', True):
                         duplicates += 1
-                        continue
-                    elif options.get('update_existing', False):
+                    elif options.get('update_existing', False) and existing_contact:
                         # Update existing contact
                         for field, value in contact_data.items():
                             if value and hasattr(existing_contact, field):
                                 setattr(existing_contact, field, value)
                         existing_contact.save()
                         successful += 1
-                        continue
-                
-                # Create new contact
-                contact = Contact.objects.create(user=user, **contact_data)
-                
-                # Add to target list if specified
-                if options.get('target_list'):
-                    contact.lists.add(options['target_list'])
-                
-                successful += 1
+                    else:
+                        import_record.record_error(row_num, 'Contact already exists')
+                        failed += 1
+                    continue
                 
-            except Exception as e:
-                import_record.add_error(row_num, str(e))
-                failed += 1
-        
-        # Update import record
-        import_record.successful_imports = successful
-        import_record.failed_imports = failed
-        import_record.duplicates_found = duplicates
-        import_record.save()
+                seen_emails.add(contact_data['email'])
+                new_contacts.append(Contact(user=user, **contact_data))
+            
+            # Create new contacts
+            inserted_ids = []
+            if new_contacts:
+                Contact.objects.bulk_create(new_contacts, ignore_conflicts=True)
+                
+                # Rows dropped as conflicts (e.g. a concurrent import of the same
+                # email) are not in the table under the pk assigned here
+                new_ids = {contact.id for contact in new_contacts}
+                inserted_ids = [
+                    contact_id for contact_id in Contact.objects.filter(
+                        user=user,
+                        email__in=[contact.email for contact in new_contacts]
+                    ).values_list('id', flat=True)
+                    if contact_id in new_ids
+                ]
+                successful += len(inserted_ids)
+                duplicates += len(new_contacts) - len(inserted_ids)
+            
+            # Add to target list if specified
+            if target_list and inserted_ids:
+                Contact.lists.through.objects.bulk_create([
+                    Contact.lists.through(contact_id=contact_id, contactlist_id=target_list.id)
+                    for contact_id in inserted_ids
+                ], ignore_conflicts=True)
+            
+            # Record progress
+            import_record.successful_imports = successful
+            import_record.failed_imports = failed
+            import_record.duplicates_found = duplicates
+            import_record.save(update_fields=[
+                'successful_imports', 'failed_imports', 'duplicates_found', 'errors'
+            ])
         
         # Update target list count
-        if options.get('target_list'):
-            options['target_list'].update_contact_count()
+        if target_list:
+            ContactList.recompute_counts([target_list.id])
         
         return {
             'successful': successful,
@@ -286,68 +339,68 @@ class ContactService:
         
         return contact_data
     
-    def export_contacts(self, user, contact_filter=None, format='csv'):
-        """Export contacts to CSV/Excel"""
-        try:
-            # Get contacts
-            contacts = user.contacts.filter(is_active=True)
-            
-            if contact_filter:
-                contacts = contacts.filter(**contact_filter)
-            
-            # Prepare data
-            export_data = []
-            for contact in contacts:
-                export_data.append({
-                    'email': contact.email,
-                    'first_name': contact.first_name or '',
-                    'last_name': contact.last_name or '',
-                    'phone': contact.phone or '',
-                    'company': contact.company or '',
-                    'job_title': contact.job_title or '',
-                    'city': contact.city or '',
-                    'country': contact.country or '',
-                    'status': contact.status,
-                    'engagement_score': contact.engagement_score,
-                    'subscribed_at': contact.subscribed_at.isoformat() if contact.subscribed_at else '',
-                    'lists': ', '.join([lst.name for lst in contact.lists.all()]),
-                    'tags': ', '.join([tag.name for tag in contact.tags.all()]),
-                })
-            
-            if format == 'csv':
-                return self._export_to_csv(export_data)
-            elif format == 'excel':
-                return self._export_to_excel(export_data)
-            else:
-                raise ValueError('Unsupported export format')
-                
-        except Exception as e:
-            logger.error(f"Contact export error: {str(e)}")
-            raise e
+    def export_contacts_iter(self, user, contact_filter=None, chunk_size=2000):
+        """Yield the contacts CSV export line by line"""
+        writer = csv.writer(Echo())
+        for row in self._export_rows(user, contact_filter, chunk_size):
+            yield writer.writerow(row)
     
-    def _export_to_csv(self, data):
-        """Export data to CSV format"""
-        if not data:
-            return ''
+    def export_contacts_excel(self, user, contact_filter=None, chunk_size=2000):
+        """Write the contacts Excel export row by row and return it as a file"""
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        for row in self._export_rows(user, contact_filter, chunk_size):
+            worksheet.append(row)
         
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=data[0].keys())
-        writer.writeheader()
-        writer.writerows(data)
+        output = tempfile.SpooledTemporaryFile(max_size=10 * 1024 * 1024)
+        workbook.save(output)
+        output.seek(0)
         
-        return output.getvalue()
+        return output
     
-    def _export_to_excel(self, data):
-        """Export data to Excel format"""
-        if not data:
-            return b''
+    def _export_rows(self, user, contact_filter, chunk_size):
+        """Yield the export header and then one list of values per contact"""
+        contacts = user.contacts.filter(is_active=True)
         
-        df = pd.DataFrame(data)
-        output = io.BytesIO()
-        df.to_excel(output, index=False, engine='openpyxl')
-        output.seek(0)
+        if contact_filter:
+            contacts = contacts.filter(**contact_filter)
+        
+        fields = [
+            'email', 'first_name', 'last_name', 'phone', 'company', 'job_title',
+            'city', 'country', 'status', 'engagement_score', 'subscribed_at',
+        ]
+        yield fields + ['lists', 'tags']
+        
+        chunk = []
+        for row in contacts.values('id', *fields).iterator(chunk_size=chunk_size):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield from self._export_chunk(chunk, fields)
+                chunk = []
+        if chunk:
+            yield from self._export_chunk(chunk, fields)
+    
+    def _export_chunk(self, chunk, fields):
+        """Format a chunk of contact rows, fetching their list and tag names in bulk"""
+        contact_ids = [row['id'] for row in chunk]
+        list_names = {}
+        for contact_id, name in Contact.lists.through.objects.filter(
+            contact_id__in=contact_ids
+        ).values_list('contact_id', 'contactlist__name'):
+            list_names.setdefault(contact_id, []).append(name)
+        tag_names = {}
+        for contact_id, name in Contact.tags.through.objects.filter(
+            contact_id__in=contact_ids
+        ).values_list('contact_id', 'contacttag__name'):
+            tag_names.setdefault(contact_id, []).append(name)
         
-        return output.getvalue()
+        for row in chunk:
+            subscribed_at = row['subscribed_at']
+            row['subscribed_at'] = subscribed_at.isoformat() if subscribed_at else ''
+            yield [row[field] if row[field] is not None else '' for field in fields] + [
+                ', '.join(list_names.get(row['id'], [])),
+                ', '.join(tag_names.get(row['id'], [])),
+            ]
     
     def bulk_update_contacts(self, contact_ids, updates):
         """Bulk update multiple contacts"""
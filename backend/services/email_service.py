@@ -3,6 +3,8 @@
 
 import yagmail
 import smtplib
+import asyncio
+import dns.asyncresolver
 import ssl
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -19,11 +21,15 @@ import re
 import base64
 import hashlib
 from datetime import timedelta
+from functools import lru_cache
 import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Prefix of the TXT record holding a domain's verification token
+VERIFICATION_RECORD_PREFIX = '_afrimail-verification'
+
 
 class EmailService:
     """
@@ -31,7 +37,15 @@ class EmailService:
     """
     
     def __init__(self):
-        self.yag_cache = {}  # Cache yagmail instances
+        # yagmail connections are not thread-safe, so each thread keeps its own
+        self._local = threading.local()
+    
+    @property
+    def yag_cache(self):
+        """Cached yagmail instances for the current thread"""
+        if not hasattr(self._local, 'yag_cache'):
+            self._local.yag_cache = {}
+        return self._local.yag_cache
     
     def get_yagmail_instance(self, email_config=None):
         """Get or create yagmail instance for given configuration"""
@@ -50,7 +64,8 @@ class EmailService:
                 return self.yag_cache[cache_key]
             
             # Use custom email configuration
-            cache_key = f"config_{email_config.id}"
+            # Keyed on updated_at so edited credentials open a new connection
+            cache_key = f"config_{email_config.id}_{email_config.updated_at.timestamp()}"
             if cache_key not in self.yag_cache:
                 if email_config.smtp_provider == 'YAGMAIL' or email_config.smtp_provider == 'GMAIL':
                     self.yag_cache[cache_key] = yagmail.SMTP(
@@ -307,7 +322,7 @@ class EmailService:
         except Exception as e:
             logger.error(f"Bulk campaign error: {str(e)}")
             campaign.status = 'FAILED'
-            campaign.save(update_fields=['status'])
+            campaign.save(update_fields=['status', 'updated_at'])
             return False
     
     def _queue_campaign_email(self, campaign, contact):
@@ -479,6 +494,10 @@ class EmailService:
     
     def test_email_configuration(self, email_config):
         """Test email configuration"""
+        return self.send_test_email(email_config)['success']
+    
+    def send_test_email(self, email_config, to_email=None):
+        """Send a configuration test email, to the config's own address by default"""
         try:
             test_subject = f"Test Email from {settings.PLATFORM_NAME}"
             test_content = f"""
@@ -490,8 +509,8 @@ class EmailService:
             <p>If you received this email, your configuration is working correctly!</p>
             """
             
-            return self.send_email(
-                to_email=email_config.from_email,
+            sent = self.send_email(
+                to_email=to_email or email_config.from_email,
                 subject=test_subject,
                 html_content=test_content,
                 from_email=email_config.from_email,
@@ -499,9 +518,62 @@ class EmailService:
                 email_config=email_config
             )
             
+            if not sent:
+                return {'success': False, 'error': 'The email could not be sent with this configuration'}
+            return {'success': True}
+            
         except Exception as e:
             logger.error(f"Test email configuration error: {str(e)}")
-            return False
+            return {'success': False, 'error': 'An error occurred while sending the test email'}
+    
+    def verify_domain(self, email_config):
+        """Check the domain's verification TXT record and collect its mail DNS records"""
+        if not email_config.verification_token:
+            return {'success': False, 'error': 'No verification token has been generated for this domain'}
+        
+        try:
+            records = asyncio.run(self.lookup_domain_records(email_config.domain_name))
+        except Exception as e:
+            logger.error(f"DNS lookup error for {email_config.domain_name}: {str(e)}")
+            return {'success': False, 'error': 'DNS lookup failed'}
+        
+        if email_config.verification_token not in records['verification']:
+            return {
+                'success': False,
+                'error': f'TXT record {VERIFICATION_RECORD_PREFIX}.{email_config.domain_name} not found',
+                'records': records,
+            }
+        
+        return {'success': True, 'records': records}
+    
+    async def lookup_domain_records(self, domain_name):
+        """Resolve the verification, SPF, DMARC and MX records of a domain concurrently"""
+        resolver = dns.asyncresolver.Resolver()
+        resolver.timeout = 2
+        resolver.lifetime = 3
+        
+        queries = {
+            'verification': (f'{VERIFICATION_RECORD_PREFIX}.{domain_name}', 'TXT'),
+            'txt': (domain_name, 'TXT'),
+            'dmarc': (f'_dmarc.{domain_name}', 'TXT'),
+            'mx': (domain_name, 'MX'),
+        }
+        answers = await asyncio.gather(
+            *(resolver.resolve(name, record_type) for name, record_type in queries.values()),
+            return_exceptions=True
+        )
+        
+        records = {}
+        for (key, (name, record_type)), answer in zip(queries.items(), answers):
+            if isinstance(answer, Exception):
+                # Missing records are expected while a domain is being set up
+                records[key] = []
+            elif record_type == 'TXT':
+                records[key] = [b''.join(rdata.strings).decode(errors='replace') for rdata in answer]
+            else:
+                records[key] = [rdata.to_text() for rdata in answer]
+        
+        return records
     
     def _encrypt_password(self, password):
         """Encrypt password for storage"""
@@ -560,4 +632,10 @@ class EmailService:
             
         except Exception as e:
             logger.error(f"Get delivery statistics error: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+
+
+@lru_cache(maxsize=1)
+def get_email_service():
+    """Process-wide EmailService so cached SMTP connections are reused between calls"""
+    return EmailService()
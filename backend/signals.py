@@ -4,7 +4,10 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
-from .models import CustomUser, UserProfile, Contact, ContactList, EmailEvent, EmailCampaign
+from .models import (
+    CustomUser, UserProfile, Contact, ContactList, EmailEvent, EmailCampaign,
+    EmailDomainConfig, UserNotification
+)
 from .tasks import send_welcome_email
 import logging
 
@@ -98,4 +101,39 @@ def log_campaign_status_change(sender, instance, created, **kwargs):
         # Check if status changed
         old_instance = EmailCampaign.objects.get(pk=instance.pk)
         if hasattr(old_instance, '_state') and old_instance.status != instance.status:
-            logger.info(f"Campaign {instance.name} status changed from {old_instance.status} to {instance.status}")
\ No newline at end of file
+            logger.info(f"Campaign {instance.name} status changed from {old_instance.status} to {instance.status}")
+
+
+@receiver(post_save, sender=EmailCampaign)
+def update_campaign_notification(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the campaign completed/failed notification in sync when its status changes"""
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    
+    if created:
+        changed = instance.status in ('SENT', 'FAILED')
+    else:
+        changed = instance.status_changed()
+    
+    if changed:
+        UserNotification.sync_campaign(instance)
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=EmailCampaign)
+def clear_campaign_notification(sender, instance, **kwargs):
+    """Remove the notification for a deleted campaign"""
+    UserNotification.clear(instance.user_id, f'campaign:{instance.pk}')
+
+
+@receiver(post_save, sender=EmailDomainConfig)
+def update_domain_notification(sender, instance, update_fields=None, **kwargs):
+    """Keep the domain verification reminder in sync"""
+    if update_fields is None or {'domain_verified', 'is_active'} & set(update_fields):
+        UserNotification.sync_domain(instance)
+
+
+@receiver(post_delete, sender=EmailDomainConfig)
+def clear_domain_notification(sender, instance, **kwargs):
+    """Remove the reminder for a deleted domain"""
+    UserNotification.clear(instance.user_id, f'domain:{instance.pk}')
@@ -0,0 +1,163 @@
+// AfriMail Pro Service Worker
+const CACHE_NAME = 'afrimail-v1.0.0';
+const STATIC_CACHE = 'afrimail-static-v1.0.0';
+const DYNAMIC_CACHE = 'afrimail-dynamic-v1.0.0';
+
+// Files to cache immediately
+const STATIC_FILES = [
+    '/',
+    '/static/css/main.css',
+    '/static/js/main.js',
+    '/static/icons/icon-192x192.png',
+    '/static/icons/icon-512x512.png',
+    '/offline/',
+];
+
+// Install event
+self.addEventListener('install', event => {
+    console.log('Service Worker: Installing...');
+    event.waitUntil(
+        caches.open(STATIC_CACHE)
+            .then(cache => {
+                console.log('Service Worker: Caching static files');
+                return cache.addAll(STATIC_FILES);
+            })
+            .catch(err => console.log('Service Worker: Cache failed', err))
+    );
+});
+
+// Activate event
+self.addEventListener('activate', event => {
+    console.log('Service Worker: Activating...');
+    event.waitUntil(
+        caches.keys().then(cacheNames => {
+            return Promise.all(
+                cacheNames.map(cache => {
+                    if (cache !== STATIC_CACHE && cache !== DYNAMIC_CACHE) {
+                        console.log('Service Worker: Clearing old cache');
+                        return caches.delete(cache);
+                    }
+                })
+            );
+        })
+    );
+});
+
+// Fetch event
+self.addEventListener('fetch', event => {
+    // Skip non-GET requests
+    if (event.request.method !== 'GET') return;
+    
+    // Skip Chrome extension requests
+    if (event.request.url.includes('chrome-extension://')) return;
+    
+    event.respondWith(
+        caches.match(event.request)
+            .then(response => {
+                // Return cached version or fetch from network
+                return response || fetch(event.request)
+                    .then(fetchResponse => {
+                        // Check if we received a valid response
+                        if (!fetchResponse || fetchResponse.status !== 200 || fetchResponse.type !== 'basic') {
+                            return fetchResponse;
+                        }
+                        
+                        // Clone the response for caching
+                        const responseToCache = fetchResponse.clone();
+                        
+                        // Cache dynamic content
+                        caches.open(DYNAMIC_CACHE)
+                            .then(cache => {
+                                cache.put(event.request, responseToCache);
+                            });
+                        
+                        return fetchResponse;
+                    })
+                    .catch(() => {
+                        // Return offline page for navigation requests
+                        if (event.request.mode === 'navigate') {
+                            return caches.match('/offline/');
+                        }
+                        
+                        // Return fallback for images
+                        if (event.request.destination === 'image') {
+                            return caches.match('/static/icons/icon-192x192.png');
+                        }
+                    });
+            })
+    );
+});
+
+// Background sync for offline actions
+self.addEventListener('sync', event => {
+    console.log('Service Worker: Background sync', event.tag);
+    
+    if (event.tag === 'background-sync') {
+        event.waitUntil(doBackgroundSync());
+    }
+});
+
+function doBackgroundSync() {
+    // Handle offline actions when back online
+    return fetch('/api/sync/')
+        .then(response => response.json())
+        .then(data => {
+            console.log('Background sync completed', data);
+        })
+        .catch(err => {
+            console.log('Background sync failed', err);
+        });
+}
+
+// Push notifications
+self.addEventListener('push', event => {
+    console.log('Service Worker: Push received', event);
+    
+    const options = {
+        body: event.data ? event.data.text() : 'New notification from AfriMail Pro',
+        icon: '/static/icons/icon-192x192.png',
+        badge: '/static/icons/badge-72x72.png',
+        vibrate: [100, 50, 100],
+        data: {
+            dateOfArrival: Date.now(),
+            primaryKey: 1
+        },
+        actions: [
+            {
+                action: 'explore',
+                title: 'View',
+                icon: '/static/icons/action-view.png'
+            },
+            {
+                action: 'close',
+                title: 'Close',
+                icon: '/static/icons/action-close.png'
+            }
+        ]
+    };
+    
+    event.waitUntil(
+        self.registration.showNotification('AfriMail Pro', options)
+    );
+});
+
+// Notification click
+self.addEventListener('notificationclick', event => {
+    console.log('Service Worker: Notification clicked', event);
+    event.notification.close();
+    
+    if (event.action === 'explore') {
+        event.waitUntil(
+            clients.openWindow('/')
+        );
+    }
+});
+
+// Message from main thread
+self.addEventListener('message', event => {
+    console.log('Service Worker: Message received', event.data);
+    
+    if (event.data && event.data.type === 'SKIP_WAITING') {
+        self.skipWaiting();
+    }
+});
@@ -6,12 +6,14 @@ from celery import shared_task
 from django.utils import timezone
 from django.conf import settings
 from django.core.mail import send_mail
+from django.db.models import F
 from .models import (
     EmailQueue, EmailCampaign, EmailDomainConfig, Contact,
-    EmailEvent, CampaignAnalytics, PlatformAnalytics, UserActivity
+    EmailEvent, CampaignAnalytics, PlatformAnalytics, UserActivity, ContactImport
 )
-from .services.email_service import EmailService
+from .services.email_service import get_email_service
 from .services.analytics_service import AnalyticsService
+from .services.contact_service import ContactService
 import logging
 from datetime import timedelta
 
@@ -32,7 +34,7 @@ def send_queued_email(self, queue_id):
         queued_email.status = 'SENDING'
         queued_email.save(update_fields=['status'])
         
-        email_service = EmailService()
+        email_service = get_email_service()
         campaign = queued_email.campaign
         contact = queued_email.contact
         
@@ -173,20 +175,94 @@ def schedule_campaigns():
         logger.error(f"Error scheduling campaigns: {str(e)}")
 
 
+@shared_task
+def process_contact_import(import_id, options=None):
+    """Parse and insert the rows of an uploaded contact import"""
+    try:
+        import_record = ContactImport.objects.select_related('user', 'target_list').get(id=import_id)
+        ContactService().process_contact_import(import_record, options)
+        
+    except ContactImport.DoesNotExist:
+        logger.error(f"Contact import {import_id} not found")
+    except Exception as e:
+        logger.error(f"Error processing contact import {import_id}: {str(e)}")
+
+
+@shared_task
+def verify_email_domain(config_id):
+    """Run DNS verification for an email domain and record the result"""
+    try:
+        email_config = EmailDomainConfig.objects.get(id=config_id)
+    except EmailDomainConfig.DoesNotExist:
+        logger.error(f"Email domain config {config_id} not found")
+        return
+    
+    try:
+        result = get_email_service().verify_domain(email_config)
+    except Exception as e:
+        logger.error(f"Domain verification error for {email_config.domain_name}: {str(e)}")
+        result = {'success': False, 'error': 'An error occurred during domain verification'}
+    
+    now = timezone.now()
+    if result.get('success'):
+        email_config.domain_verified = True
+        email_config.verification_status = 'VERIFIED'
+        email_config.last_verification_attempt = now
+        email_config.save(update_fields=[
+            'domain_verified', 'verification_status', 'last_verification_attempt', 'updated_at'
+        ])
+    else:
+        logger.warning(f"Domain verification failed for {email_config.domain_name}: {result.get('error')}")
+        # Increment in SQL so concurrent attempts are all counted
+        EmailDomainConfig.objects.filter(pk=email_config.pk).update(
+            verification_attempts=F('verification_attempts') + 1,
+            verification_status='FAILED',
+            last_verification_attempt=now,
+            updated_at=now
+        )
+
+
+@shared_task
+def send_config_test_email(config_id, test_email):
+    """Send a test email through an email domain configuration"""
+    try:
+        email_config = EmailDomainConfig.objects.get(id=config_id)
+        result = get_email_service().send_test_email(email_config, test_email)
+        
+        if not result.get('success'):
+            logger.warning(f"Test email to {test_email} failed for {email_config.domain_name}: {result.get('error')}")
+        
+    except EmailDomainConfig.DoesNotExist:
+        logger.error(f"Email domain config {config_id} not found")
+    except Exception as e:
+        logger.error(f"Error sending test email for config {config_id}: {str(e)}")
+
+
 @shared_task
 def update_engagement_scores():
     """Update engagement scores for all contacts"""
     try:
-        contacts = Contact.objects.filter(is_active=True)
+        # Load only the counters the score is computed from
+        contacts = Contact.objects.filter(is_active=True).only(
+            'id', 'engagement_score', 'total_emails_received', 'total_emails_opened',
+            'total_emails_clicked', 'last_email_opened_at'
+        )
         
         updated_count = 0
-        for contact in contacts:
+        changed = []
+        for contact in contacts.iterator(chunk_size=2000):
             old_score = contact.engagement_score
             new_score = contact.calculate_engagement_score()
             
             if abs(old_score - new_score) > 0.1:  # Only save if significant change
-                contact.save(update_fields=['engagement_score'])
-                updated_count += 1
+                changed.append(contact)
+            
+            if len(changed) >= 500:
+                updated_count += Contact.objects.bulk_update(changed, ['engagement_score'])
+                changed = []
+        
+        if changed:
+            updated_count += Contact.objects.bulk_update(changed, ['engagement_score'])
         
         logger.info(f"Updated engagement scores for {updated_count} contacts")
         
@@ -346,7 +422,7 @@ def send_welcome_email(user_id):
         <p><small>AfriMail Pro - Connectez l'Afrique, Un Email à la Fois</small></p>
         """
         
-        email_service = EmailService()
+        email_service = get_email_service()
         result = email_service.send_email(
             to_email=user.email,
             subject=subject,
@@ -408,7 +484,7 @@ def send_digest_email(user_id, digest_type='weekly'):
         The AfriMail Pro Team</p>
         """
         
-        email_service = EmailService()
+        email_service = get_email_service()
         result = email_service.send_email(
             to_email=user.email,
             subject=subject,
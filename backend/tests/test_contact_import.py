@@ -0,0 +1,71 @@
+# backend/tests/test_contact_import.py
+
+from unittest import mock
+
+from django.test import TestCase
+
+from ..models import Contact, ContactImport, ContactList, CustomUser
+from ..services.contact_service import ContactService
+
+
+class ContactImportTests(TestCase):
+    """Imported rows are validated, deduplicated and added to the target list"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.target_list = ContactList.objects.create(user=self.user, name='Imported')
+        self.import_record = ContactImport.objects.create(
+            user=self.user, file_name='contacts.csv', target_list=self.target_list
+        )
+        Contact.objects.create(user=self.user, email='existing@example.com')
+    
+    def run_import(self, rows, **options):
+        options.setdefault('target_list', self.target_list)
+        return ContactService()._process_contact_import(
+            self.user, rows, self.import_record, options, batch_size=2
+        )
+    
+    def test_import_counts_and_list_membership(self):
+        result = self.run_import([
+            {'email': 'new@example.com', 'first_name': 'New'},
+            {'email': ''},
+            {'email': 'not-an-email'},
+            {'email': 'existing@example.com'},
+            {'email': 'other@example.com'},
+            {'email': 'new@example.com'},
+        ])
+        
+        self.assertEqual(result, {'successful': 2, 'failed': 2, 'duplicates': 2, 'total': 6})
+        self.assertEqual(
+            set(self.target_list.contacts.values_list('email', flat=True)),
+            {'new@example.com', 'other@example.com'}
+        )
+        self.target_list.refresh_from_db()
+        self.assertEqual(self.target_list.contact_count, 2)
+        
+        self.import_record.refresh_from_db()
+        self.assertEqual(self.import_record.successful_imports, 2)
+        self.assertEqual([error['row'] for error in self.import_record.errors], [2, 3])
+    
+    def test_rows_dropped_as_conflicts_are_not_counted(self):
+        bulk_create = Contact.objects.bulk_create
+        
+        def racing_bulk_create(objs, **kwargs):
+            # Another import inserts the same email between the check and the insert
+            Contact.objects.create(user=self.user, email='race@example.com')
+            return bulk_create(objs, **kwargs)
+        
+        with mock.patch.object(Contact.objects, 'bulk_create', side_effect=racing_bulk_create):
+            result = self.run_import([
+                {'email': 'race@example.com'},
+                {'email': 'fresh@example.com'},
+            ])
+        
+        self.assertEqual(result['successful'], 1)
+        self.assertEqual(result['duplicates'], 1)
+        self.assertEqual(
+            list(self.target_list.contacts.values_list('email', flat=True)),
+            ['fresh@example.com']
+        )
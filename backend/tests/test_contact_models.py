@@ -0,0 +1,43 @@
+# backend/tests/test_contact_models.py
+
+from django.test import TestCase
+
+from ..models import Contact, ContactList, CustomUser
+
+
+class ContactListRecomputeCountsTests(TestCase):
+    """recompute_counts stores the number of active contacts per list"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.customers = ContactList.objects.create(user=self.user, name='Customers', contact_count=42)
+        self.leads = ContactList.objects.create(user=self.user, name='Leads', contact_count=7)
+        self.empty = ContactList.objects.create(user=self.user, name='Empty', contact_count=3)
+        
+        active = Contact.objects.create(user=self.user, email='active@example.com')
+        inactive = Contact.objects.create(user=self.user, email='inactive@example.com', is_active=False)
+        other = Contact.objects.create(user=self.user, email='other@example.com')
+        active.lists.add(self.customers, self.leads)
+        inactive.lists.add(self.customers)
+        other.lists.add(self.customers)
+    
+    def counts(self):
+        return dict(ContactList.objects.values_list('name', 'contact_count'))
+    
+    def test_counts_active_contacts_of_each_list(self):
+        with self.assertNumQueries(1):
+            updated = ContactList.recompute_counts([self.customers.id, self.leads.id, self.empty.id])
+        
+        self.assertEqual(updated, 3)
+        self.assertEqual(self.counts(), {'Customers': 2, 'Leads': 1, 'Empty': 0})
+    
+    def test_only_given_lists_are_updated(self):
+        ContactList.recompute_counts(iter([self.leads.id, self.leads.id]))
+        
+        self.assertEqual(self.counts(), {'Customers': 42, 'Leads': 1, 'Empty': 3})
+    
+    def test_no_lists_runs_no_query(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(ContactList.recompute_counts([]), 0)
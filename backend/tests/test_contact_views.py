@@ -0,0 +1,51 @@
+# backend/tests/test_contact_views.py
+
+import json
+
+from django.test import TestCase
+from django.urls import reverse
+
+from ..models import Contact, CustomUser
+
+
+class ContactBulkActionsTests(TestCase):
+    """Bulk actions only touch the requesting user's contacts"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.contact = Contact.objects.create(user=self.user, email='contact@example.com')
+        self.client.force_login(self.user)
+    
+    def post(self, contact_ids):
+        return self.client.post(
+            reverse('backend:contact_bulk_actions'),
+            json.dumps({'action': 'delete', 'contact_ids': contact_ids}),
+            content_type='application/json'
+        )
+    
+    def test_ids_in_any_uuid_format_are_accepted(self):
+        response = self.post([str(self.contact.pk).upper()])
+        
+        self.assertTrue(response.json()['success'])
+        self.contact.refresh_from_db()
+        self.assertFalse(self.contact.is_active)
+    
+    def test_malformed_id_is_rejected(self):
+        response = self.post([str(self.contact.pk), 'not-a-uuid'])
+        
+        self.assertEqual(response.status_code, 400)
+        self.contact.refresh_from_db()
+        self.assertTrue(self.contact.is_active)
+    
+    def test_other_users_contact_is_reported_missing(self):
+        other = CustomUser.objects.create(
+            email='other@example.com', first_name='Bo', last_name='Other', company='Example'
+        )
+        foreign = Contact.objects.create(user=other, email='contact@example.com')
+        
+        response = self.post([str(self.contact.pk), str(foreign.pk)])
+        
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['missing_ids'], [str(foreign.pk)])
@@ -0,0 +1,49 @@
+# backend/tests/test_email_tasks.py
+
+from unittest import mock
+
+from django.test import TestCase
+
+from ..models import CustomUser, EmailDomainConfig
+from ..tasks import send_config_test_email
+
+
+class SendConfigTestEmailTaskTests(TestCase):
+    """The queued test email goes out through the config's SMTP server"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.email_config = EmailDomainConfig.objects.create(
+            user=self.user,
+            domain_name='example.com',
+            from_email='news@example.com',
+            from_name='Example News',
+            smtp_provider='CUSTOM',
+            smtp_host='smtp.example.com',
+            smtp_username='news@example.com',
+            smtp_password='c2VjcmV0',
+            domain_verified=True,
+        )
+    
+    @mock.patch('backend.services.email_service.smtplib.SMTP')
+    def test_task_sends_message_to_recipient(self, smtp_class):
+        send_config_test_email.apply(args=[str(self.email_config.pk), 'tester@example.org'])
+        
+        server = smtp_class.return_value
+        smtp_class.assert_called_once_with('smtp.example.com', 587)
+        server.login.assert_called_once_with('news@example.com', 'secret')
+        server.send_message.assert_called_once()
+        message = server.send_message.call_args[0][0]
+        self.assertEqual(message['To'], 'tester@example.org')
+        self.assertEqual(message['From'], 'Example News <news@example.com>')
+        
+        self.email_config.refresh_from_db()
+        self.assertEqual(self.email_config.emails_sent_today, 1)
+    
+    @mock.patch('backend.services.email_service.smtplib.SMTP')
+    def test_task_sends_nothing_for_unknown_config(self, smtp_class):
+        send_config_test_email.apply(args=['00000000-0000-0000-0000-000000000000', 'tester@example.org'])
+        
+        smtp_class.assert_not_called()
@@ -0,0 +1,48 @@
+# backend/tests/test_email_views.py
+
+from unittest import mock
+
+from django.test import TestCase
+from django.urls import reverse
+from kombu.exceptions import OperationalError
+
+from ..models import CustomUser, EmailDomainConfig
+
+
+class EmailConfigAjaxQueueTests(TestCase):
+    """The domain AJAX endpoints report a clear error when the broker is down"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.email_config = EmailDomainConfig.objects.create(
+            user=self.user,
+            domain_name='example.com',
+            from_email='news@example.com',
+            from_name='Example News',
+        )
+        self.client.force_login(self.user)
+    
+    @mock.patch('backend.views.email_views.verify_email_domain.delay')
+    def test_domain_verify_queued(self, delay):
+        response = self.client.post(reverse('backend:domain_verify_ajax'), {'config_id': self.email_config.pk})
+        
+        self.assertEqual(response.json()['status'], 'pending')
+        delay.assert_called_once_with(str(self.email_config.pk))
+    
+    @mock.patch('backend.views.email_views.verify_email_domain.delay', side_effect=OperationalError('refused'))
+    def test_domain_verify_broker_down(self, delay):
+        response = self.client.post(reverse('backend:domain_verify_ajax'), {'config_id': self.email_config.pk})
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('could not be queued', response.json()['error'])
+    
+    @mock.patch('backend.views.email_views.send_config_test_email.delay', side_effect=ConnectionRefusedError)
+    def test_test_email_broker_down(self, delay):
+        response = self.client.post(reverse('backend:email_test_ajax'), {
+            'config_id': self.email_config.pk, 'test_email': 'tester@example.org'
+        })
+        
+        self.assertEqual(response.status_code, 503)
+        self.assertIn('could not be queued', response.json()['error'])
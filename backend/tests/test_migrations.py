@@ -0,0 +1,43 @@
+# backend/tests/test_migrations.py
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+class EmailEventUserBackfillTests(TransactionTestCase):
+    """The 0010-0012 migrations copy each event's campaign owner onto the event"""
+
+    migrate_from = [('backend', '0010_email_event_user')]
+    migrate_to = [('backend', '0012_email_event_user_not_null')]
+
+    def setUp(self):
+        executor = MigrationExecutor(connection)
+        self.latest = executor.loader.graph.leaf_nodes()
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+
+        User = apps.get_model('backend', 'CustomUser')
+        EmailCampaign = apps.get_model('backend', 'EmailCampaign')
+        Contact = apps.get_model('backend', 'Contact')
+        EmailEvent = apps.get_model('backend', 'EmailEvent')
+
+        self.user = User.objects.create(email='owner@example.com', first_name='A', last_name='B', company='C')
+        campaign = EmailCampaign.objects.create(
+            user=self.user, name='Campaign', subject='Subject',
+            from_email='owner@example.com', from_name='Owner', html_content='<p>Hi</p>'
+        )
+        contact = Contact.objects.create(user=self.user, email='contact@example.com')
+        self.event = EmailEvent.objects.create(campaign=campaign, contact=contact, event_type='SENT')
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.latest)
+
+    def test_backfill_sets_event_user(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+        apps = executor.loader.project_state(self.migrate_to).apps
+        EmailEvent = apps.get_model('backend', 'EmailEvent')
+
+        self.assertEqual(EmailEvent.objects.get(pk=self.event.pk).user_id, self.user.pk)
@@ -0,0 +1,63 @@
+# backend/tests/test_notifications.py
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from ..models import CustomUser, EmailCampaign, UserNotification
+
+
+class CampaignNotificationSyncTests(TestCase):
+    """Campaign notifications follow status changes and keep their timestamp"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        self.campaign = EmailCampaign.objects.create(
+            user=self.user,
+            name='Launch',
+            subject='Hello',
+            from_email='news@example.com',
+            from_name='Example News',
+            html_content='<p>Hello</p>',
+        )
+        self.key = f'campaign:{self.campaign.pk}'
+    
+    def get_notification(self):
+        return UserNotification.objects.get(user=self.user, key=self.key)
+    
+    def test_draft_campaign_has_no_notification(self):
+        self.assertFalse(UserNotification.objects.filter(key=self.key).exists())
+    
+    def test_sent_campaign_creates_success_notification(self):
+        self.campaign.complete_sending()
+        
+        notification = self.get_notification()
+        self.assertEqual(notification.type, 'success')
+        self.assertEqual(notification.timestamp, self.campaign.completed_at)
+    
+    def test_failed_campaign_keeps_timestamp_on_later_saves(self):
+        self.campaign.status = 'FAILED'
+        self.campaign.save()
+        timestamp = self.get_notification().timestamp
+        self.assertEqual(timestamp, self.campaign.updated_at)
+        
+        campaign = EmailCampaign.objects.get(pk=self.campaign.pk)
+        campaign.name = 'Renamed'
+        with CaptureQueriesContext(connection) as queries:
+            campaign.save()
+        
+        self.assertFalse(any('user_notifications' in q['sql'] for q in queries.captured_queries))
+        self.assertEqual(self.get_notification().timestamp, timestamp)
+    
+    def test_back_to_draft_clears_notification(self):
+        self.campaign.status = 'FAILED'
+        self.campaign.save()
+        self.assertEqual(self.get_notification().type, 'error')
+        
+        campaign = EmailCampaign.objects.get(pk=self.campaign.pk)
+        campaign.status = 'DRAFT'
+        campaign.save()
+        
+        self.assertFalse(UserNotification.objects.filter(key=self.key).exists())
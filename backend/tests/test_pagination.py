@@ -0,0 +1,63 @@
+# backend/tests/test_pagination.py
+
+import base64
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Contact, CustomUser
+from ..pagination import KeysetPaginator
+
+
+class KeysetPaginatorTests(TestCase):
+    """Cursor pages cover every row once, in order, in both directions"""
+    
+    def setUp(self):
+        self.user = CustomUser.objects.create(
+            email='owner@example.com', first_name='Ada', last_name='Owner', company='Example'
+        )
+        now = timezone.now()
+        for i in range(7):
+            contact = Contact.objects.create(user=self.user, email=f'contact{i}@example.com')
+            # Pairs of contacts share a timestamp so the pk tie-break is exercised
+            Contact.objects.filter(pk=contact.pk).update(created_at=now - timedelta(minutes=i // 2))
+        self.paginator = KeysetPaginator(Contact.objects.filter(user=self.user), 3)
+        self.expected = list(self.paginator.object_list.values_list('pk', flat=True))
+    
+    def pks(self, page):
+        return [contact.pk for contact in page]
+    
+    def test_walks_all_pages_forward_and_back(self):
+        pages = [self.paginator.get_page()]
+        while pages[-1].has_next():
+            page = pages[-1]
+            pages.append(self.paginator.get_page(after=page.next_cursor, number=page.next_page_number()))
+        
+        self.assertEqual([page.number for page in pages], list(self.paginator.page_range))
+        self.assertEqual(sum((self.pks(page) for page in pages), []), self.expected)
+        self.assertFalse(pages[0].has_previous())
+        self.assertIsNone(pages[-1].next_cursor)
+        
+        page = pages[-1]
+        while page.has_previous():
+            page = self.paginator.get_page(before=page.previous_cursor, number=page.previous_page_number())
+            self.assertEqual(self.pks(page), self.pks(pages[page.number - 1]))
+        self.assertEqual(page.number, 1)
+    
+    def test_page_number_without_cursor(self):
+        second = self.paginator.get_page(after=self.paginator.get_page().next_cursor, number=2)
+        
+        self.assertEqual(self.pks(self.paginator.get_page(number='2')), self.pks(second))
+        self.assertEqual(self.paginator.get_page(number='99').number, self.paginator.num_pages)
+    
+    def test_malformed_cursor_falls_back_to_first_page(self):
+        first = self.pks(self.paginator.get_page())
+        bad_pk = base64.urlsafe_b64encode(f'{timezone.now().isoformat()}|not-a-uuid'.encode()).decode()
+        
+        for cursor in ['not-a-cursor', '!!!', 'Zm9vfGJhcg==', bad_pk]:
+            page = self.paginator.get_page(after=cursor, number='x')
+            self.assertEqual(page.number, 1)
+            self.assertFalse(page.has_previous())
+            self.assertEqual(self.pks(page), first)
+            self.assertEqual(self.pks(self.paginator.get_page(before=cursor)), first)
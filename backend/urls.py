@@ -30,6 +30,7 @@ urlpatterns = [
         path('<uuid:pk>/edit/', views.ContactUpdateView.as_view(), name='contact_update'),
         path('<uuid:pk>/delete/', views.ContactDeleteView.as_view(), name='contact_delete'),
         path('import/', views.ContactImportView.as_view(), name='contact_import'),
+        path('import/<uuid:import_id>/', views.ContactImportStatusView.as_view(), name='contact_import_status'),
         path('export/', views.ContactExportView.as_view(), name='contact_export'),
         path('bulk-actions/', views.ContactBulkActionsView.as_view(), name='contact_bulk_actions'),
     ])),
@@ -94,5 +95,6 @@ urlpatterns = [
         path('campaign-stats/', views.CampaignStatsAjaxView.as_view(), name='campaign_stats_ajax'),
         path('email-test/', views.EmailTestAjaxView.as_view(), name='email_test_ajax'),
         path('domain-verify/', views.DomainVerifyAjaxView.as_view(), name='domain_verify_ajax'),
+        path('domain-verify/<uuid:pk>/', views.DomainVerifyStatusAjaxView.as_view(), name='domain_verify_status_ajax'),
     ])),
 ]
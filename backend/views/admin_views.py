@@ -481,7 +481,7 @@ class EmailLogsView(ListView):
             queryset = queryset.filter(event_type=event_type)
         
         if user_id:
-            queryset = queryset.filter(campaign__user_id=user_id)
+            queryset = queryset.filter(user_id=user_id)
         
         if campaign_id:
             queryset = queryset.filter(campaign_id=campaign_id)
@@ -63,7 +63,7 @@ class AnalyticsOverviewView(TemplateView):
                 created_at__range=[start_date, end_date]
             ).count(),
             'total_emails_sent': EmailEvent.objects.filter(
-                campaign__user=user,
+                user=user,
                 event_type='SENT',
                 created_at__range=[start_date, end_date]
             ).count(),
@@ -587,17 +587,17 @@ class RealTimeStatsView(View):
             # Get real-time stats
             stats = {
                 'emails_sent': EmailEvent.objects.filter(
-                    campaign__user=user,
+                    user=user,
                     event_type='SENT',
                     created_at__gte=start_time
                 ).count(),
                 'emails_opened': EmailEvent.objects.filter(
-                    campaign__user=user,
+                    user=user,
                     event_type='OPENED',
                     created_at__gte=start_time
                 ).count(),
                 'emails_clicked': EmailEvent.objects.filter(
-                    campaign__user=user,
+                    user=user,
                     event_type='CLICKED',
                     created_at__gte=start_time
                 ).count(),
@@ -636,7 +636,7 @@ class EngagementTrendsView(View):
                 date_obj = timezone.now().date() - timedelta(days=i)
                 
                 events = EmailEvent.objects.filter(
-                    campaign__user=user,
+                    user=user,
                     created_at__date=date_obj
                 )
                 
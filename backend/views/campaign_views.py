@@ -21,7 +21,7 @@ from ..models import (
     EmailEvent, EmailQueue, Contact
 )
 from ..forms import EmailCampaignForm, EmailTemplateForm, CampaignSearchForm
-from ..services import CampaignService, EmailService
+from ..services import CampaignService, get_email_service
 from ..authentication import PermissionManager
 
 logger = logging.getLogger(__name__)
@@ -297,7 +297,7 @@ class CampaignPreviewView(DetailView):
         
         if sample_contact:
             # Personalize content with sample contact
-            email_service = EmailService()
+            email_service = get_email_service()
             personalized_html = email_service._personalize_content(
                 campaign.html_content, sample_contact
             )
@@ -606,7 +606,7 @@ class SendTestEmailView(View):
             )
             
             # Send test email
-            email_service = EmailService()
+            email_service = get_email_service()
             result = email_service.send_email(
                 to_email=test_email,
                 subject=f"[TEST] {campaign.subject}",
@@ -5,16 +5,19 @@ from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView, DetailView, TemplateView
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse, FileResponse
 from django.urls import reverse_lazy, reverse
 from django.utils import timezone
-from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.utils.functional import cached_property
+from django.db import IntegrityError, transaction
+from django.db.models import Q, Count, Sum
+from django.db.models.functions import Coalesce, TruncDate
 from django.views.decorators.csrf import csrf_exempt
 from django.views import View
 import json
 import csv
 import logging
+import uuid
 from datetime import timedelta
 
 from ..models import (
@@ -26,12 +29,19 @@ from ..forms import (
 )
 from ..services import ContactService
 from ..authentication import PermissionManager
+from ..pagination import KeysetPaginationMixin, KeysetPaginator
 
 logger = logging.getLogger(__name__)
 
+ContactListThrough = Contact.lists.through
+ContactTagThrough = Contact.tags.through
+
+# Columns rendered on paginated contact tables
+CONTACT_LIST_FIELDS = ('id', 'email', 'first_name', 'last_name', 'status', 'company', 'created_at')
+
 
 @method_decorator(login_required, name='dispatch')
-class ContactListView(ListView):
+class ContactListView(KeysetPaginationMixin, ListView):
     """List all contacts for the user"""
     
     model = Contact
@@ -39,11 +49,15 @@ class ContactListView(ListView):
     context_object_name = 'contacts'
     paginate_by = 25
     
+    @cached_property
+    def search_form(self):
+        return ContactSearchForm(self.request.user, self.request.GET)
+    
     def get_queryset(self):
         queryset = Contact.objects.filter(user=self.request.user, is_active=True).order_by('-created_at')
         
         # Apply search filters
-        search_form = ContactSearchForm(self.request.user, self.request.GET)
+        search_form = self.search_form
         if search_form.is_valid():
             search = search_form.cleaned_data.get('search')
             status = search_form.cleaned_data.get('status')
@@ -67,25 +81,25 @@ class ContactListView(ListView):
             if country:
                 queryset = queryset.filter(country__icontains=country)
         
-        return queryset.select_related().prefetch_related('lists', 'tags')
+        return queryset.only(*CONTACT_LIST_FIELDS).prefetch_related('lists', 'tags')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
         # Add search form
-        context['search_form'] = ContactSearchForm(self.request.user, self.request.GET)
+        context['search_form'] = self.search_form
         
         # Add summary statistics
-        user_contacts = Contact.objects.filter(user=self.request.user, is_active=True)
-        context['stats'] = {
-            'total_contacts': user_contacts.count(),
-            'active_contacts': user_contacts.filter(status='ACTIVE').count(),
-            'unsubscribed_contacts': user_contacts.filter(status='UNSUBSCRIBED').count(),
-            'bounced_contacts': user_contacts.filter(status='BOUNCED').count(),
-            'new_contacts_today': user_contacts.filter(
-                created_at__date=timezone.now().date()
-            ).count(),
-        }
+        context['stats'] = Contact.objects.filter(
+            user=self.request.user,
+            is_active=True
+        ).aggregate(
+            total_contacts=Count('id'),
+            active_contacts=Count('id', filter=Q(status='ACTIVE')),
+            unsubscribed_contacts=Count('id', filter=Q(status='UNSUBSCRIBED')),
+            bounced_contacts=Count('id', filter=Q(status='BOUNCED')),
+            new_contacts_today=Count('id', filter=Q(created_at__date=timezone.now().date())),
+        )
         
         # Add contact lists for bulk operations
         context['contact_lists'] = ContactList.objects.filter(
@@ -120,19 +134,16 @@ class ContactCreateView(CreateView):
         
         form.instance.user = self.request.user
         
-        # Check for duplicate email
-        if Contact.objects.filter(
-            user=self.request.user,
-            email=form.instance.email
-        ).exists():
+        # Duplicate emails are rejected by the (user, email) unique constraint
+        try:
+            with transaction.atomic():
+                contact = form.save()
+        except IntegrityError:
             messages.error(self.request, 'A contact with this email already exists.')
             return self.form_invalid(form)
         
-        contact = form.save()
-        
         # Update list counts
-        for contact_list in contact.lists.all():
-            contact_list.update_contact_count()
+        ContactList.recompute_counts(contact.lists.values_list('id', flat=True))
         
         messages.success(self.request, f'Contact "{contact.get_full_name()}" created successfully!')
         return redirect('backend:contact_detail', pk=contact.pk)
@@ -154,14 +165,17 @@ class ContactDetailView(DetailView):
         contact = self.object
         
         # Get email history
-        context['email_events'] = EmailEvent.objects.filter(
+        email_events = list(EmailEvent.objects.filter(
             contact=contact
-        ).order_by('-created_at')[:20]
+        ).select_related('campaign').defer(
+            'campaign__html_content', 'campaign__text_content'
+        ).order_by('-created_at')[:20])
+        context['email_events'] = email_events
         
         # Get campaigns this contact received
         context['campaigns_received'] = EmailCampaign.objects.filter(
-            events__contact=contact
-        ).distinct().order_by('-created_at')[:10]
+            id__in=EmailEvent.objects.filter(contact=contact).values('campaign_id')
+        ).order_by('-created_at')[:10]
         
         # Get engagement metrics
         context['engagement_metrics'] = {
@@ -175,16 +189,12 @@ class ContactDetailView(DetailView):
         }
         
         # Get recent activity timeline
-        recent_events = EmailEvent.objects.filter(
-            contact=contact
-        ).order_by('-created_at')[:10]
-        
         context['activity_timeline'] = [{
             'event_type': event.event_type,
             'campaign_name': event.campaign.name,
             'created_at': event.created_at,
             'metadata': event.event_data,
-        } for event in recent_events]
+        } for event in email_events[:10]]
         
         return context
 
@@ -206,19 +216,20 @@ class ContactUpdateView(UpdateView):
         return kwargs
     
     def form_valid(self, form):
-        # Check for duplicate email (excluding current contact)
-        if Contact.objects.filter(
-            user=self.request.user,
-            email=form.instance.email
-        ).exclude(pk=self.object.pk).exists():
+        old_list_ids = set(self.object.lists.values_list('id', flat=True))
+        
+        # Duplicate emails are rejected by the (user, email) unique constraint
+        try:
+            with transaction.atomic():
+                contact = form.save()
+        except IntegrityError:
             messages.error(self.request, 'A contact with this email already exists.')
             return self.form_invalid(form)
         
-        contact = form.save()
-        
-        # Update list counts
-        for contact_list in contact.lists.all():
-            contact_list.update_contact_count()
+        # Update list counts for lists the contact left or joined
+        ContactList.recompute_counts(
+            old_list_ids | set(contact.lists.values_list('id', flat=True))
+        )
         
         messages.success(self.request, f'Contact "{contact.get_full_name()}" updated successfully!')
         return redirect('backend:contact_detail', pk=contact.pk)
@@ -237,7 +248,7 @@ class ContactDeleteView(DeleteView):
     
     def delete(self, request, *args, **kwargs):
         contact = self.get_object()
-        contact_lists = list(contact.lists.all())
+        contact_list_ids = list(contact.lists.values_list('id', flat=True))
         contact_name = contact.get_full_name()
         
         # Soft delete - mark as inactive instead of actually deleting
@@ -245,8 +256,7 @@ class ContactDeleteView(DeleteView):
         contact.save()
         
         # Update list counts
-        for contact_list in contact_lists:
-            contact_list.update_contact_count()
+        ContactList.recompute_counts(contact_list_ids)
         
         messages.success(request, f'Contact "{contact_name}" deleted successfully!')
         return redirect(self.success_url)
@@ -291,10 +301,7 @@ class ContactImportView(TemplateView):
             if result['success']:
                 messages.success(
                     request,
-                    f'Import started successfully! '
-                    f'{result["result"]["successful"]} contacts imported, '
-                    f'{result["result"]["failed"]} failed, '
-                    f'{result["result"]["duplicates"]} duplicates skipped.'
+                    'Import started successfully! Progress is shown on this page.'
                 )
                 return redirect('backend:contact_import_status', import_id=result['import_id'])
             else:
@@ -315,7 +322,7 @@ class ContactImportStatusView(DetailView):
     pk_url_kwarg = 'import_id'
     
     def get_queryset(self):
-        return ContactImport.objects.filter(user=self.request.user)
+        return ContactImport.objects.filter(user=self.request.user).select_related('user', 'target_list')
 
 
 @method_decorator(login_required, name='dispatch')
@@ -338,24 +345,21 @@ class ContactExportView(View):
         contact_service = ContactService()
         try:
             if format_type == 'csv':
-                export_data = contact_service.export_contacts(
-                    user=request.user,
-                    contact_filter=contact_filter,
-                    format='csv'
+                response = StreamingHttpResponse(
+                    contact_service.export_contacts_iter(
+                        user=request.user,
+                        contact_filter=contact_filter
+                    ),
+                    content_type='text/csv'
                 )
-                
-                response = HttpResponse(export_data, content_type='text/csv')
                 response['Content-Disposition'] = f'attachment; filename="contacts_{timezone.now().strftime("%Y%m%d")}.csv"'
                 
             else:  # Excel
-                export_data = contact_service.export_contacts(
-                    user=request.user,
-                    contact_filter=contact_filter,
-                    format='excel'
-                )
-                
-                response = HttpResponse(
-                    export_data,
+                response = FileResponse(
+                    contact_service.export_contacts_excel(
+                        user=request.user,
+                        contact_filter=contact_filter
+                    ),
                     content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
                 )
                 response['Content-Disposition'] = f'attachment; filename="contacts_{timezone.now().strftime("%Y%m%d")}.xlsx"'
@@ -381,27 +385,41 @@ class ContactBulkActionsView(View):
             if not contact_ids:
                 return JsonResponse({'success': False, 'error': 'No contacts selected'})
             
+            try:
+                contact_ids = {uuid.UUID(str(contact_id)) for contact_id in contact_ids}
+            except (TypeError, ValueError):
+                return JsonResponse({'success': False, 'error': 'Invalid contact ID'}, status=400)
+            
             # Verify contacts belong to user
-            contacts = Contact.objects.filter(
+            owned = set(Contact.objects.filter(
                 id__in=contact_ids,
                 user=request.user
-            )
+            ).values_list('id', flat=True))
+            
+            missing = contact_ids - owned
+            if missing:
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Some contacts not found',
+                    'missing_ids': sorted(map(str, missing))
+                }, status=400)
             
-            if contacts.count() != len(contact_ids):
-                return JsonResponse({'success': False, 'error': 'Some contacts not found'})
+            contacts = Contact.objects.filter(id__in=owned)
             
             if action == 'delete':
                 # Soft delete contacts
                 contacts.update(is_active=False)
                 
                 # Update list counts
-                for contact in contacts:
-                    for contact_list in contact.lists.all():
-                        contact_list.update_contact_count()
+                ContactList.recompute_counts(
+                    Contact.lists.through.objects.filter(
+                        contact_id__in=owned
+                    ).values_list('contactlist_id', flat=True).distinct()
+                )
                 
                 return JsonResponse({
                     'success': True,
-                    'message': f'{contacts.count()} contacts deleted successfully'
+                    'message': f'{len(owned)} contacts deleted successfully'
                 })
             
             elif action == 'add_to_list':
@@ -416,14 +434,16 @@ class ContactBulkActionsView(View):
                 )
                 
                 # Add contacts to list
-                for contact in contacts:
-                    contact.lists.add(contact_list)
+                ContactListThrough.objects.bulk_create([
+                    ContactListThrough(contact_id=contact_id, contactlist_id=contact_list.id)
+                    for contact_id in owned
+                ], ignore_conflicts=True)
                 
-                contact_list.update_contact_count()
+                ContactList.recompute_counts([contact_list.id])
                 
                 return JsonResponse({
                     'success': True,
-                    'message': f'{contacts.count()} contacts added to "{contact_list.name}"'
+                    'message': f'{len(owned)} contacts added to "{contact_list.name}"'
                 })
             
             elif action == 'remove_from_list':
@@ -438,14 +458,13 @@ class ContactBulkActionsView(View):
                 )
                 
                 # Remove contacts from list
-                for contact in contacts:
-                    contact.lists.remove(contact_list)
+                contact_list.contacts.remove(*owned)
                 
-                contact_list.update_contact_count()
+                ContactList.recompute_counts([contact_list.id])
                 
                 return JsonResponse({
                     'success': True,
-                    'message': f'{contacts.count()} contacts removed from "{contact_list.name}"'
+                    'message': f'{len(owned)} contacts removed from "{contact_list.name}"'
                 })
             
             elif action == 'add_tag':
@@ -460,12 +479,14 @@ class ContactBulkActionsView(View):
                 )
                 
                 # Add tag to contacts
-                for contact in contacts:
-                    contact.tags.add(tag)
+                ContactTagThrough.objects.bulk_create([
+                    ContactTagThrough(contact_id=contact_id, contacttag_id=tag.id)
+                    for contact_id in owned
+                ], ignore_conflicts=True)
                 
                 return JsonResponse({
                     'success': True,
-                    'message': f'Tag "{tag.name}" added to {contacts.count()} contacts'
+                    'message': f'Tag "{tag.name}" added to {len(owned)} contacts'
                 })
             
             elif action == 'update_status':
@@ -477,7 +498,7 @@ class ContactBulkActionsView(View):
                 
                 return JsonResponse({
                     'success': True,
-                    'message': f'{contacts.count()} contacts updated to {new_status}'
+                    'message': f'{len(owned)} contacts updated to {new_status}'
                 })
             
             else:
@@ -510,11 +531,11 @@ class ContactListsView(ListView):
         context = super().get_context_data(**kwargs)
         
         # Add summary statistics
-        context['stats'] = {
-            'total_lists': self.get_queryset().count(),
-            'total_contacts_in_lists': sum([lst.contact_count for lst in self.get_queryset()]),
-            'favorite_lists': self.get_queryset().filter(is_favorite=True).count(),
-        }
+        context['stats'] = self.get_queryset().aggregate(
+            total_lists=Count('id'),
+            total_contacts_in_lists=Coalesce(Sum('contact_count'), 0),
+            favorite_lists=Count('id', filter=Q(is_favorite=True)),
+        )
         
         return context
 
@@ -553,9 +574,10 @@ class ContactListDetailView(DetailView):
         contacts = contact_list.contacts.filter(is_active=True).order_by('-created_at')
         
         # Paginate contacts
-        paginator = Paginator(contacts, 25)
-        page_number = self.request.GET.get('page')
-        page_obj = paginator.get_page(page_number)
+        paginator = KeysetPaginator(contacts.only(*CONTACT_LIST_FIELDS), 25)
+        page_obj = paginator.get_page(
+            self.request.GET.get('after'), self.request.GET.get('before'), self.request.GET.get('page')
+        )
         
         context['contacts'] = page_obj
         context['is_paginated'] = page_obj.has_other_pages()
@@ -660,18 +682,18 @@ class QuickAddContactView(View):
             if not email:
                 return JsonResponse({'success': False, 'error': 'Email is required'})
             
-            # Check if contact already exists
-            if Contact.objects.filter(user=request.user, email=email).exists():
+            # Create contact; the (user, email) unique constraint rejects duplicates
+            try:
+                with transaction.atomic():
+                    contact = Contact.objects.create(
+                        user=request.user,
+                        email=email,
+                        first_name=first_name,
+                        last_name=last_name
+                    )
+            except IntegrityError:
                 return JsonResponse({'success': False, 'error': 'Contact already exists'})
             
-            # Create contact
-            contact = Contact.objects.create(
-                user=request.user,
-                email=email,
-                first_name=first_name,
-                last_name=last_name
-            )
-            
             # Add to list if specified
             if list_id:
                 try:
@@ -679,8 +701,10 @@ class QuickAddContactView(View):
                         id=list_id,
                         user=request.user
                     )
-                    contact.lists.add(contact_list)
-                    contact_list.update_contact_count()
+                    ContactListThrough.objects.bulk_create([
+                        ContactListThrough(contact_id=contact.id, contactlist_id=contact_list.id)
+                    ], ignore_conflicts=True)
+                    ContactList.recompute_counts([contact_list.id])
                 except ContactList.DoesNotExist:
                     pass
             
@@ -716,32 +740,37 @@ class ContactEngagementView(DetailView):
         contact = self.object
         
         # Get engagement data for the last 30 days
-        from datetime import timedelta
-        thirty_days_ago = timezone.now() - timedelta(days=30)
+        now = timezone.now()
+        thirty_days_ago = now - timedelta(days=30)
+        
+        # Count events per day and type in one grouped query
+        counts = {
+            (row['day'], row['event_type']): row['count']
+            for row in EmailEvent.objects.filter(
+                contact=contact,
+                created_at__gte=thirty_days_ago,
+                event_type__in=['OPENED', 'CLICKED', 'SENT']
+            ).annotate(
+                day=TruncDate('created_at')
+            ).order_by().values('day', 'event_type').annotate(count=Count('id'))
+        }
         
         # Get daily engagement data
+        today = timezone.localdate(now)
         engagement_data = []
-        for i in range(30):
-            date = (timezone.now() - timedelta(days=i)).date()
-            
-            events = EmailEvent.objects.filter(
-                contact=contact,
-                created_at__date=date
-            )
-            
+        for i in range(29, -1, -1):
+            date = today - timedelta(days=i)
             engagement_data.append({
                 'date': date.isoformat(),
-                'opens': events.filter(event_type='OPENED').count(),
-                'clicks': events.filter(event_type='CLICKED').count(),
+                'opens': counts.get((date, 'OPENED'), 0),
+                'clicks': counts.get((date, 'CLICKED'), 0),
             })
         
-        context['engagement_data'] = list(reversed(engagement_data))
+        context['engagement_data'] = engagement_data
         
         # Get email frequency
-        context['email_frequency'] = EmailEvent.objects.filter(
-            contact=contact,
-            event_type='SENT',
-            created_at__gte=thirty_days_ago
-        ).count()
+        context['email_frequency'] = sum(
+            count for (day, event_type), count in counts.items() if event_type == 'SENT'
+        )
         
         return context
\ No newline at end of file
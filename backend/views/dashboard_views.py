@@ -6,11 +6,15 @@ from django.utils.decorators import method_decorator
 from django.views.generic import TemplateView
 from django.http import JsonResponse
 from django.utils import timezone
-from django.db.models import Count, Q
-from datetime import timedelta
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import TruncDate
+from datetime import datetime, time, timedelta
+from operator import itemgetter
+from types import MappingProxyType
 from ..models import (
     CustomUser, Contact, ContactList, EmailCampaign, EmailDomainConfig,
-    EmailEvent, CampaignAnalytics, UserActivity
+    EmailEvent, CampaignAnalytics, UserActivity, UserNotification
 )
 from ..authentication import PermissionManager
 from ..services import AnalyticsService
@@ -18,6 +22,22 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Campaign columns shown in dashboard tables, including the open/click rate inputs
+CAMPAIGN_SUMMARY_FIELDS = (
+    'id', 'name', 'subject', 'status', 'created_at', 'emails_sent',
+    'emails_delivered', 'unique_opens', 'unique_clicks',
+)
+
+# Aggregate filters shared by the dashboard and quick stats
+STATUS_SENT = Q(status='SENT')
+STATUS_SENDING = Q(status='SENDING')
+STATUS_DRAFT = Q(status='DRAFT')
+EVENT_SENT = Q(event_type='SENT')
+EVENT_OPENED = Q(event_type='OPENED')
+EVENT_CLICKED = Q(event_type='CLICKED')
+ACTIVE_CONTACT = Q(is_active=True)
+SUBSCRIBED_CONTACT = Q(status='ACTIVE', is_active=True)
+
 
 @method_decorator(login_required, name='dispatch')
 class DashboardView(TemplateView):
@@ -34,34 +54,35 @@ class DashboardView(TemplateView):
     def render_client_dashboard(self, request):
         """Render client user dashboard"""
         user = request.user
+        now = timezone.now()
         
         # Get basic statistics
         total_contacts = user.contacts.filter(is_active=True).count()
-        total_campaigns = user.email_campaigns.count()
         total_lists = user.contact_lists.filter(is_active=True).count()
         total_email_configs = user.email_domains.filter(is_active=True).count()
         
         # Get recent campaigns
-        recent_campaigns = user.email_campaigns.all()[:5]
-        
-        # Get campaign statistics for the last 30 days
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        recent_campaign_stats = user.email_campaigns.filter(
-            created_at__gte=thirty_days_ago
-        ).aggregate(
-            total_sent=Count('id', filter=Q(status='SENT')),
-            total_sending=Count('id', filter=Q(status='SENDING')),
-            total_draft=Count('id', filter=Q(status='DRAFT'))
+        recent_campaigns = user.email_campaigns.only(*CAMPAIGN_SUMMARY_FIELDS)[:5]
+        
+        # Get the campaign total and statistics for the last 30 days in one query
+        thirty_days_ago = now - timedelta(days=30)
+        recent = Q(created_at__gte=thirty_days_ago)
+        recent_campaign_stats = user.email_campaigns.aggregate(
+            total_campaigns=Count('id'),
+            total_sent=Count('id', filter=recent & STATUS_SENT),
+            total_sending=Count('id', filter=recent & STATUS_SENDING),
+            total_draft=Count('id', filter=recent & STATUS_DRAFT)
         )
+        total_campaigns = recent_campaign_stats.pop('total_campaigns')
         
         # Get top performing campaigns
         top_campaigns = user.email_campaigns.filter(
             status='SENT',
             emails_delivered__gt=0
-        ).order_by('-unique_opens')[:3]
+        ).only(*CAMPAIGN_SUMMARY_FIELDS).order_by('-unique_opens')[:3]
         
         # Get contact growth data for the last 7 days
-        contact_growth = self.get_contact_growth_data(user)
+        contact_growth = self.get_contact_growth_data(user, now)
         
         # Get recent activities
         recent_activities = user.activities.all()[:5]
@@ -89,28 +110,47 @@ class DashboardView(TemplateView):
         
         return render(request, 'dashboard/client_dashboard.html', context)
     
-    def get_contact_growth_data(self, user):
+    def get_contact_growth_data(self, user, now=None):
         """Get contact growth data for charts"""
         growth_data = []
+        today = timezone.localdate(now)
+        start = today - timedelta(days=6)
+        contacts = user.contacts.filter(is_active=True)
+        
+        # Contacts that existed before the window, then new contacts per day
+        count = contacts.filter(created_at__date__lt=start).count()
+        daily = dict(
+            contacts.filter(
+                created_at__date__gte=start
+            ).annotate(
+                day=TruncDate('created_at')
+            ).order_by().values('day').annotate(count=Count('id')).values_list('day', 'count')
+        )
         
         for i in range(7):
-            date = timezone.now().date() - timedelta(days=i)
-            count = user.contacts.filter(
-                created_at__date__lte=date,
-                is_active=True
-            ).count()
+            date = start + timedelta(days=i)
+            count += daily.get(date, 0)
             growth_data.append({
                 'date': date.strftime('%Y-%m-%d'),
                 'count': count
             })
         
-        return list(reversed(growth_data))
+        return growth_data
     
     def get_engagement_metrics(self, user):
         """Get user engagement metrics"""
         campaigns = user.email_campaigns.filter(status='SENT')
+        open_rate = EmailCampaign.rate_expression('unique_opens')
+        
+        stats = campaigns.aggregate(
+            count=Count('id'),
+            avg_open_rate=Avg(open_rate),
+            avg_click_rate=Avg(EmailCampaign.rate_expression('unique_clicks')),
+            total_opens=Sum('unique_opens'),
+            total_clicks=Sum('unique_clicks'),
+        )
         
-        if not campaigns.exists():
+        if not stats['count']:
             return {
                 'avg_open_rate': 0,
                 'avg_click_rate': 0,
@@ -119,20 +159,15 @@ class DashboardView(TemplateView):
                 'engagement_trend': 'stable'
             }
         
-        total_open_rate = sum([c.open_rate for c in campaigns])
-        total_click_rate = sum([c.click_rate for c in campaigns])
-        
-        avg_open_rate = total_open_rate / campaigns.count()
-        avg_click_rate = total_click_rate / campaigns.count()
-        
         # Get recent trend (last 5 campaigns vs previous 5)
-        recent_campaigns = campaigns.order_by('-created_at')[:5]
-        previous_campaigns = campaigns.order_by('-created_at')[5:10]
-        
         engagement_trend = 'stable'
-        if recent_campaigns.exists() and previous_campaigns.exists():
-            recent_avg = sum([c.open_rate for c in recent_campaigns]) / recent_campaigns.count()
-            previous_avg = sum([c.open_rate for c in previous_campaigns]) / previous_campaigns.count()
+        if stats['count'] > 5:
+            # Fetch the last 10 open rates once and split them in Python
+            open_rates = list(campaigns.order_by('-created_at').annotate(
+                rate=open_rate
+            ).values_list('rate', flat=True)[:10])
+            recent_avg = sum(open_rates[:5]) / len(open_rates[:5])
+            previous_avg = sum(open_rates[5:]) / len(open_rates[5:])
             
             if recent_avg > previous_avg + 5:
                 engagement_trend = 'up'
@@ -140,26 +175,16 @@ class DashboardView(TemplateView):
                 engagement_trend = 'down'
         
         return {
-            'avg_open_rate': round(avg_open_rate, 1),
-            'avg_click_rate': round(avg_click_rate, 1),
-            'total_opens': sum([c.unique_opens for c in campaigns]),
-            'total_clicks': sum([c.unique_clicks for c in campaigns]),
+            'avg_open_rate': round(stats['avg_open_rate'], 1),
+            'avg_click_rate': round(stats['avg_click_rate'], 1),
+            'total_opens': stats['total_opens'],
+            'total_clicks': stats['total_clicks'],
             'engagement_trend': engagement_trend
         }
     
     def get_setup_status(self, user):
         """Check user setup completion status"""
-        setup_steps = {
-            'profile_completed': bool(
-                user.first_name and user.last_name and user.company
-            ),
-            'email_config_added': user.email_domains.filter(is_active=True).exists(),
-            'domain_verified': user.email_domains.filter(
-                is_active=True, domain_verified=True
-            ).exists(),
-            'contacts_added': user.contacts.filter(is_active=True).exists(),
-            'first_campaign_sent': user.email_campaigns.filter(status='SENT').exists(),
-        }
+        setup_steps = dict(user.setup_flags)
         
         completed_steps = sum(setup_steps.values())
         total_steps = len(setup_steps)
@@ -178,44 +203,50 @@ class DashboardView(TemplateView):
 class QuickStatsAPIView(TemplateView):
     """API view for quick dashboard statistics"""
     
+    # Polled by the dashboard; a few seconds of staleness is acceptable
+    cache_timeout = 15
+    
     def get(self, request, *args, **kwargs):
         user = request.user
+        stats = cache.get_or_set(
+            f'quickstats:{user.pk}',
+            lambda: self.get_stats(user),
+            timeout=self.cache_timeout
+        )
         
-        # Get real-time statistics
+        return JsonResponse(stats)
+    
+    def get_stats(self, user):
+        """Compute the quick statistics for a user"""
+        today = timezone.localdate()
+        today_start = timezone.make_aware(datetime.combine(today, time.min))
+        
+        # Get real-time statistics, one aggregate per table
         stats = {
-            'contacts': {
-                'total': user.contacts.filter(is_active=True).count(),
-                'active': user.contacts.filter(status='ACTIVE', is_active=True).count(),
-                'subscribed_today': user.contacts.filter(
-                    subscribed_at__date=timezone.now().date()
-                ).count(),
-            },
-            'campaigns': {
-                'total': user.email_campaigns.count(),
-                'draft': user.email_campaigns.filter(status='DRAFT').count(),
-                'sending': user.email_campaigns.filter(status='SENDING').count(),
-                'sent': user.email_campaigns.filter(status='SENT').count(),
-            },
-            'emails': {
-                'sent_today': EmailEvent.objects.filter(
-                    campaign__user=user,
-                    event_type='SENT',
-                    created_at__date=timezone.now().date()
-                ).count(),
-                'opened_today': EmailEvent.objects.filter(
-                    campaign__user=user,
-                    event_type='OPENED',
-                    created_at__date=timezone.now().date()
-                ).count(),
-                'clicked_today': EmailEvent.objects.filter(
-                    campaign__user=user,
-                    event_type='CLICKED',
-                    created_at__date=timezone.now().date()
-                ).count(),
-            }
+            'contacts': user.contacts.aggregate(
+                total=Count('id', filter=ACTIVE_CONTACT),
+                active=Count('id', filter=SUBSCRIBED_CONTACT),
+                subscribed_today=Count('id', filter=Q(subscribed_at__date=today)),
+            ),
+            'campaigns': user.email_campaigns.aggregate(
+                total=Count('id'),
+                draft=Count('id', filter=STATUS_DRAFT),
+                sending=Count('id', filter=STATUS_SENDING),
+                sent=Count('id', filter=STATUS_SENT),
+            ),
+            'emails': EmailEvent.objects.filter(
+                user=user,
+                event_type__in=['SENT', 'OPENED', 'CLICKED'],
+                created_at__gte=today_start,
+                created_at__lt=today_start + timedelta(days=1)
+            ).aggregate(
+                sent_today=Count('id', filter=EVENT_SENT),
+                opened_today=Count('id', filter=EVENT_OPENED),
+                clicked_today=Count('id', filter=EVENT_CLICKED),
+            ),
         }
         
-        return JsonResponse(stats)
+        return stats
 
 
 @method_decorator(login_required, name='dispatch')
@@ -228,65 +259,88 @@ class NotificationsView(TemplateView):
         context = super().get_context_data(**kwargs)
         user = self.request.user
         
-        # Get notifications (using activities for now)
-        notifications = []
-        
-        # Recent campaign completions
-        completed_campaigns = user.email_campaigns.filter(
-            status='SENT',
-            completed_at__gte=timezone.now() - timedelta(days=7)
-        )
-        
-        for campaign in completed_campaigns:
-            notifications.append({
-                'type': 'success',
-                'title': 'Campaign Completed',
-                'message': f'Your campaign "{campaign.name}" has been sent to {campaign.emails_sent} recipients.',
-                'timestamp': campaign.completed_at,
-                'action_url': f'/campaigns/{campaign.id}/',
-            })
-        
-        # Failed campaigns
-        failed_campaigns = user.email_campaigns.filter(
-            status='FAILED',
-            updated_at__gte=timezone.now() - timedelta(days=7)
-        )
-        
-        for campaign in failed_campaigns:
-            notifications.append({
-                'type': 'error',
-                'title': 'Campaign Failed',
-                'message': f'Your campaign "{campaign.name}" failed to send. Please check your email configuration.',
-                'timestamp': campaign.updated_at,
-                'action_url': f'/campaigns/{campaign.id}/',
-            })
-        
-        # Domain verification reminders
-        unverified_domains = user.email_domains.filter(
-            domain_verified=False,
-            is_active=True
-        )
-        
-        for domain in unverified_domains:
-            notifications.append({
-                'type': 'warning',
-                'title': 'Domain Verification Pending',
-                'message': f'Please verify your domain "{domain.domain_name}" to start sending emails.',
-                'timestamp': domain.created_at,
-                'action_url': f'/email-config/{domain.id}/verify/',
-            })
-        
-        # Sort by timestamp
-        notifications.sort(key=lambda x: x['timestamp'], reverse=True)
+        # Notifications are written by signals on campaign and domain changes
+        now = timezone.now()
+        notifications = UserNotification.active_for(user, now)
         
         context.update({
-            'notifications': notifications[:20],  # Latest 20 notifications
-            'unread_count': len([n for n in notifications if n['timestamp'] > timezone.now() - timedelta(hours=24)]),
+            'notifications': notifications.order_by('-timestamp')[:20],  # Latest 20 notifications
+            'unread_count': notifications.filter(
+                timestamp__gt=now - timedelta(hours=24)
+            ).count(),
         })
         
         return context
 
 
+# Help center content is static, so it is built once at import
+
+# Help articles organized by category
+HELP_ARTICLES = MappingProxyType({
+    'Getting Started': (
+        {
+            'title': 'Setting up your first email domain',
+            'description': 'Learn how to configure your email domain for sending campaigns.',
+            'url': '/help/email-domain-setup/',
+        },
+        {
+            'title': 'Importing your contacts',
+            'description': 'Step-by-step guide to importing contacts from CSV files.',
+            'url': '/help/import-contacts/',
+        },
+        {
+            'title': 'Creating your first campaign',
+            'description': 'Complete guide to creating and sending your first email campaign.',
+            'url': '/help/first-campaign/',
+        },
+    ),
+    'Email Configuration': (
+        {
+            'title': 'SPF, DKIM, and DMARC setup',
+            'description': 'Configure DNS records for better email deliverability.',
+            'url': '/help/dns-setup/',
+        },
+        {
+            'title': 'Using Gmail/G Suite with AfriMail Pro',
+            'description': 'Connect your Gmail or G Suite account for sending emails.',
+            'url': '/help/gmail-setup/',
+        },
+    ),
+    'Campaigns & Analytics': (
+        {
+            'title': 'Understanding email analytics',
+            'description': 'Learn about open rates, click rates, and other important metrics.',
+            'url': '/help/analytics/',
+        },
+        {
+            'title': 'Best practices for email marketing',
+            'description': 'Tips to improve your email marketing performance.',
+            'url': '/help/best-practices/',
+        },
+    ),
+})
+
+# FAQ items
+FAQ_ITEMS = (
+    {
+        'question': 'What is the maximum number of contacts I can have?',
+        'answer': 'The default limit is 10,000 contacts. Contact us if you need to increase this limit.',
+    },
+    {
+        'question': 'How many emails can I send per month?',
+        'answer': 'The default limit is 50,000 emails per month. This can be adjusted based on your plan.',
+    },
+    {
+        'question': 'Do you support custom SMTP servers?',
+        'answer': 'Yes, you can configure custom SMTP servers in addition to using our platform email service.',
+    },
+    {
+        'question': 'How do I improve my email deliverability?',
+        'answer': 'Make sure to verify your domain, set up proper DNS records (SPF, DKIM, DMARC), and maintain good sending practices.',
+    },
+)
+
+
 @method_decorator(login_required, name='dispatch')
 class HelpCenterView(TemplateView):
     """Help center view"""
@@ -296,74 +350,9 @@ class HelpCenterView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Help articles organized by category
-        help_articles = {
-            'Getting Started': [
-                {
-                    'title': 'Setting up your first email domain',
-                    'description': 'Learn how to configure your email domain for sending campaigns.',
-                    'url': '/help/email-domain-setup/',
-                },
-                {
-                    'title': 'Importing your contacts',
-                    'description': 'Step-by-step guide to importing contacts from CSV files.',
-                    'url': '/help/import-contacts/',
-                },
-                {
-                    'title': 'Creating your first campaign',
-                    'description': 'Complete guide to creating and sending your first email campaign.',
-                    'url': '/help/first-campaign/',
-                },
-            ],
-            'Email Configuration': [
-                {
-                    'title': 'SPF, DKIM, and DMARC setup',
-                    'description': 'Configure DNS records for better email deliverability.',
-                    'url': '/help/dns-setup/',
-                },
-                {
-                    'title': 'Using Gmail/G Suite with AfriMail Pro',
-                    'description': 'Connect your Gmail or G Suite account for sending emails.',
-                    'url': '/help/gmail-setup/',
-                },
-            ],
-            'Campaigns & Analytics': [
-                {
-                    'title': 'Understanding email analytics',
-                    'description': 'Learn about open rates, click rates, and other important metrics.',
-                    'url': '/help/analytics/',
-                },
-                {
-                    'title': 'Best practices for email marketing',
-                    'description': 'Tips to improve your email marketing performance.',
-                    'url': '/help/best-practices/',
-                },
-            ],
-        }
-        
-        # FAQ items
-        faq_items = [
-            {
-                'question': 'What is the maximum number of contacts I can have?',
-                'answer': 'The default limit is 10,000 contacts. Contact us if you need to increase this limit.',
-            },
-            {
-                'question': 'How many emails can I send per month?',
-                'answer': 'The default limit is 50,000 emails per month. This can be adjusted based on your plan.',
-            },
-            {
-                'question': 'Do you support custom SMTP servers?',
-                'answer': 'Yes, you can configure custom SMTP servers in addition to using our platform email service.',
-            },
-            {
-                'question': 'How do I improve my email deliverability?',
-                'answer': 'Make sure to verify your domain, set up proper DNS records (SPF, DKIM, DMARC), and maintain good sending practices.',
-            },
-        ]
-        
         context.update({
-            'help_articles': help_articles,
-            'faq_items': faq_items,
+            'help_articles': HELP_ARTICLES,
+            'faq_items': FAQ_ITEMS,
         })
         
         return context
@@ -378,6 +367,7 @@ class OnboardingView(TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         user = self.request.user
+        flags = user.setup_flags
         
         # Onboarding steps
         steps = [
@@ -385,7 +375,7 @@ class OnboardingView(TemplateView):
                 'id': 'profile',
                 'title': 'Complete Your Profile',
                 'description': 'Add your company information and preferences.',
-                'completed': bool(user.first_name and user.last_name and user.company),
+                'completed': flags['profile_completed'],
                 'url': '/auth/profile/',
                 'icon': 'user'
             },
@@ -393,7 +383,7 @@ class OnboardingView(TemplateView):
                 'id': 'email_config',
                 'title': 'Configure Email Domain',
                 'description': 'Set up your email domain for sending campaigns.',
-                'completed': user.email_domains.filter(is_active=True).exists(),
+                'completed': flags['email_config_added'],
                 'url': '/email-config/create/',
                 'icon': 'mail'
             },
@@ -401,7 +391,7 @@ class OnboardingView(TemplateView):
                 'id': 'verify_domain',
                 'title': 'Verify Your Domain',
                 'description': 'Verify your domain ownership for better deliverability.',
-                'completed': user.email_domains.filter(domain_verified=True).exists(),
+                'completed': flags['domain_verified'],
                 'url': '/email-config/',
                 'icon': 'shield-check'
             },
@@ -409,7 +399,7 @@ class OnboardingView(TemplateView):
                 'id': 'import_contacts',
                 'title': 'Import Contacts',
                 'description': 'Upload your contact list to start sending campaigns.',
-                'completed': user.contacts.filter(is_active=True).exists(),
+                'completed': flags['contacts_added'],
                 'url': '/contacts/import/',
                 'icon': 'users'
             },
@@ -417,14 +407,14 @@ class OnboardingView(TemplateView):
                 'id': 'first_campaign',
                 'title': 'Send Your First Campaign',
                 'description': 'Create and send your first email campaign.',
-                'completed': user.email_campaigns.filter(status='SENT').exists(),
+                'completed': flags['first_campaign_sent'],
                 'url': '/campaigns/create/',
                 'icon': 'send'
             },
         ]
         
         # Calculate progress
-        completed_steps = sum(1 for step in steps if step['completed'])
+        completed_steps = sum(map(itemgetter('completed'), steps))
         progress_percentage = (completed_steps / len(steps)) * 100
         
         context.update({
@@ -461,51 +451,51 @@ class SearchView(TemplateView):
         total_results = 0
         
         # Search contacts
-        contacts = user.contacts.filter(
+        contacts = list(user.contacts.filter(
             Q(email__icontains=query) |
             Q(first_name__icontains=query) |
             Q(last_name__icontains=query) |
             Q(company__icontains=query),
             is_active=True
-        )[:10]
+        )[:10])
         
         if contacts:
             results['contacts'] = contacts
-            total_results += contacts.count()
+            total_results += len(contacts)
         
         # Search campaigns
-        campaigns = user.email_campaigns.filter(
+        campaigns = list(user.email_campaigns.filter(
             Q(name__icontains=query) |
             Q(subject__icontains=query) |
             Q(description__icontains=query)
-        )[:10]
+        )[:10])
         
         if campaigns:
             results['campaigns'] = campaigns
-            total_results += campaigns.count()
+            total_results += len(campaigns)
         
         # Search contact lists
-        contact_lists = user.contact_lists.filter(
+        contact_lists = list(user.contact_lists.filter(
             Q(name__icontains=query) |
             Q(description__icontains=query),
             is_active=True
-        )[:10]
+        )[:10])
         
         if contact_lists:
             results['contact_lists'] = contact_lists
-            total_results += contact_lists.count()
+            total_results += len(contact_lists)
         
         # Search email configurations
-        email_configs = user.email_domains.filter(
+        email_configs = list(user.email_domains.filter(
             Q(domain_name__icontains=query) |
             Q(from_email__icontains=query) |
             Q(from_name__icontains=query),
             is_active=True
-        )[:10]
+        )[:10])
         
         if email_configs:
             results['email_configs'] = email_configs
-            total_results += email_configs.count()
+            total_results += len(email_configs)
         
         context.update({
             'query': query,
@@ -9,18 +9,45 @@ from django.http import JsonResponse, HttpResponse
 from django.urls import reverse_lazy, reverse
 from django.utils import timezone
 from django.core.paginator import Paginator
-from django.db.models import Q, Count
+from django.db.models import Q, Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
 from django.views.decorators.csrf import csrf_exempt
 from django.views import View
+from datetime import timedelta
+from uuid import uuid4
+from kombu.exceptions import OperationalError as BrokerError
 import json
 import logging
 
-from ..models import EmailDomainConfig
+from ..models import EmailDomainConfig, EmailEvent
 from ..forms import EmailDomainConfigForm
-from ..services.email_service import EmailService
+from ..pagination import PKPaginator
+from ..tasks import verify_email_domain, send_config_test_email
 
 logger = logging.getLogger(__name__)
 
+# DNS record and credential columns only shown on the detail and edit pages
+EMAIL_CONFIG_LIST_DEFERRED = (
+    'smtp_password', 'verification_token', 'spf_record', 'dkim_record', 'dmarc_record',
+)
+
+# Suggested DNS records shown until the domain's own records are known
+SPF_DEFAULT = 'v=spf1 include:_spf.google.com ~all'
+DKIM_PLACEHOLDER = 'Generated after domain verification'
+DKIM_VERIFY_PLACEHOLDER = 'Generated after successful verification'
+
+# Raised by .delay() when the Celery broker cannot be reached
+QUEUE_ERRORS = (BrokerError, OSError)
+
+
+class ReuseObjectMixin:
+    """Let a DetailView's get() reuse the object its post() already loaded"""
+    
+    def get_object(self, queryset=None):
+        if getattr(self, 'object', None) is not None:
+            return self.object
+        return super().get_object(queryset)
+
 
 @method_decorator(login_required, name='dispatch')
 class EmailConfigListView(ListView):
@@ -30,23 +57,25 @@ class EmailConfigListView(ListView):
     template_name = 'email_config/email_config_list.html'
     context_object_name = 'email_configs'
     paginate_by = 20
+    paginator_class = PKPaginator
     
     def get_queryset(self):
         return EmailDomainConfig.objects.filter(
             user=self.request.user,
             is_active=True
-        ).order_by('-created_at')
+        ).defer(*EMAIL_CONFIG_LIST_DEFERRED).order_by('-created_at')
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Add summary statistics
-        context['stats'] = {
-            'total_configs': self.get_queryset().count(),
-            'verified_configs': self.get_queryset().filter(domain_verified=True).count(),
-            'pending_verification': self.get_queryset().filter(domain_verified=False).count(),
-            'default_config': self.get_queryset().filter(is_default=True).first(),
-        }
+        # Add summary statistics in one aggregate over the listed configs
+        stats = self.object_list.aggregate(
+            total_configs=Count('id'),
+            verified_configs=Count('id', filter=Q(domain_verified=True)),
+            pending_verification=Count('id', filter=Q(domain_verified=False)),
+        )
+        stats['default_config'] = self.object_list.filter(is_default=True).first()
+        context['stats'] = stats
         
         return context
 
@@ -64,8 +93,7 @@ class EmailConfigCreateView(CreateView):
         form.instance.user = self.request.user
         
         # Generate verification token
-        import uuid
-        form.instance.verification_token = str(uuid.uuid4())
+        form.instance.verification_token = uuid4().hex
         
         result = super().form_valid(form)
         
@@ -92,7 +120,19 @@ class EmailConfigDetailView(DetailView):
     context_object_name = 'email_config'
     
     def get_queryset(self):
-        return EmailDomainConfig.objects.filter(user=self.request.user)
+        # Usage for the last 30 days and the remaining quotas come back with the config row
+        thirty_days_ago = timezone.now() - timedelta(days=30)
+        sent_30_days = EmailEvent.objects.filter(
+            campaign__email_config=OuterRef('pk'),
+            event_type='SENT',
+            created_at__gte=thirty_days_ago
+        ).order_by().values('campaign__email_config').annotate(total=Count('id')).values('total')
+        
+        return EmailDomainConfig.objects.select_related('user').filter(user=self.request.user).annotate(
+            emails_sent_30_days=Coalesce(Subquery(sent_30_days), 0),
+            emails_remaining_today=Greatest(F('daily_send_limit') - F('emails_sent_today'), Value(0)),
+            emails_remaining_month=Greatest(F('monthly_send_limit') - F('emails_sent_this_month'), Value(0)),
+        )
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -100,20 +140,16 @@ class EmailConfigDetailView(DetailView):
         
         # DNS records for display
         context['dns_records'] = {
-            'spf': email_config.spf_record or f'v=spf1 include:_spf.google.com ~all',
-            'dkim': email_config.dkim_record or f'Generated after domain verification',
+            'spf': email_config.spf_record or SPF_DEFAULT,
+            'dkim': email_config.dkim_record or DKIM_PLACEHOLDER,
             'dmarc': email_config.dmarc_record or f'v=DMARC1; p=none; rua=mailto:dmarc@{email_config.domain_name}',
         }
         
-        # Usage statistics for the last 30 days
-        from datetime import timedelta
-        thirty_days_ago = timezone.now() - timedelta(days=30)
-        
-        # This would be calculated from EmailEvent model
+        # Usage statistics annotated in get_queryset
         context['usage_stats'] = {
-            'emails_sent_30_days': 0,  # TODO: Calculate from EmailEvent
-            'emails_remaining_today': max(0, email_config.daily_send_limit - email_config.emails_sent_today),
-            'emails_remaining_month': max(0, email_config.monthly_send_limit - email_config.emails_sent_this_month),
+            'emails_sent_30_days': email_config.emails_sent_30_days,
+            'emails_remaining_today': email_config.emails_remaining_today,
+            'emails_remaining_month': email_config.emails_remaining_month,
         }
         
         return context
@@ -129,7 +165,7 @@ class EmailConfigUpdateView(UpdateView):
     success_url = reverse_lazy('backend:email_config_list')
     
     def get_queryset(self):
-        return EmailDomainConfig.objects.filter(user=self.request.user)
+        return EmailDomainConfig.objects.select_related('user').filter(user=self.request.user)
     
     def form_valid(self, form):
         # If domain name changed, reset verification
@@ -139,8 +175,7 @@ class EmailConfigUpdateView(UpdateView):
             form.instance.verification_attempts = 0
             
             # Generate new verification token
-            import uuid
-            form.instance.verification_token = str(uuid.uuid4())
+            form.instance.verification_token = uuid4().hex
         
         result = super().form_valid(form)
         
@@ -166,7 +201,7 @@ class EmailConfigDeleteView(DeleteView):
     success_url = reverse_lazy('backend:email_config_list')
     
     def get_queryset(self):
-        return EmailDomainConfig.objects.filter(user=self.request.user)
+        return EmailDomainConfig.objects.select_related('user').filter(user=self.request.user)
     
     def delete(self, request, *args, **kwargs):
         email_config = self.get_object()
@@ -174,7 +209,7 @@ class EmailConfigDeleteView(DeleteView):
         
         # Soft delete - mark as inactive instead of actually deleting
         email_config.is_active = False
-        email_config.save()
+        email_config.save(update_fields=['is_active', 'updated_at'])
         
         messages.success(
             request, 
@@ -185,7 +220,7 @@ class EmailConfigDeleteView(DeleteView):
 
 
 @method_decorator(login_required, name='dispatch')
-class EmailConfigVerifyView(DetailView):
+class EmailConfigVerifyView(ReuseObjectMixin, DetailView):
     """Verify email domain configuration"""
     
     model = EmailDomainConfig
@@ -193,45 +228,24 @@ class EmailConfigVerifyView(DetailView):
     context_object_name = 'email_config'
     
     def get_queryset(self):
-        return EmailDomainConfig.objects.filter(user=self.request.user)
+        return EmailDomainConfig.objects.select_related('user').filter(user=self.request.user)
     
     def post(self, request, *args, **kwargs):
-        """Handle domain verification attempt"""
-        email_config = self.get_object()
+        """Queue a domain verification attempt"""
+        email_config = self.object = self.get_object()
         
+        # DNS lookups can take several seconds, so they run in the background
+        email_config.verification_status = 'PENDING'
+        email_config.save(update_fields=['verification_status', 'updated_at'])
         try:
-            # Use EmailService to verify domain
-            email_service = EmailService()
-            verification_result = email_service.verify_domain(email_config)
-            
-            if verification_result.get('success'):
-                email_config.domain_verified = True
-                email_config.verification_status = 'VERIFIED'
-                email_config.last_verification_attempt = timezone.now()
-                email_config.save()
-                
-                messages.success(
-                    request,
-                    f'Domain "{email_config.domain_name}" has been successfully verified!'
-                )
-                
-                return redirect('backend:email_config_detail', pk=email_config.pk)
-            else:
-                email_config.verification_attempts += 1
-                email_config.verification_status = 'FAILED'
-                email_config.last_verification_attempt = timezone.now()
-                email_config.save()
-                
-                messages.error(
-                    request,
-                    f'Domain verification failed: {verification_result.get("error", "Unknown error")}'
-                )
-        
-        except Exception as e:
-            logger.error(f"Domain verification error for {email_config.domain_name}: {str(e)}")
-            messages.error(
+            verify_email_domain.delay(str(email_config.pk))
+        except QUEUE_ERRORS as e:
+            logger.error(f"Could not queue domain verification for {email_config.pk}: {str(e)}")
+            messages.error(request, 'Domain verification could not be queued. Please try again in a few minutes.')
+        else:
+            messages.info(
                 request,
-                'An error occurred during domain verification. Please try again later.'
+                f'Verification of "{email_config.domain_name}" has started. Check back in a moment for the result.'
             )
         
         return self.get(request, *args, **kwargs)
@@ -248,8 +262,8 @@ class EmailConfigVerifyView(DetailView):
                 'type': 'TXT'
             },
             'dns_records': {
-                'spf': f'v=spf1 include:_spf.google.com ~all',
-                'dkim': f'Generated after successful verification',
+                'spf': SPF_DEFAULT,
+                'dkim': DKIM_VERIFY_PLACEHOLDER,
                 'dmarc': f'v=DMARC1; p=none; rua=mailto:dmarc@{email_config.domain_name}'
             }
         }
@@ -258,7 +272,7 @@ class EmailConfigVerifyView(DetailView):
 
 
 @method_decorator(login_required, name='dispatch')
-class EmailConfigTestView(DetailView):
+class EmailConfigTestView(ReuseObjectMixin, DetailView):
     """Test email domain configuration"""
     
     model = EmailDomainConfig
@@ -266,34 +280,22 @@ class EmailConfigTestView(DetailView):
     context_object_name = 'email_config'
     
     def get_queryset(self):
-        return EmailDomainConfig.objects.filter(user=self.request.user)
+        return EmailDomainConfig.objects.select_related('user').filter(user=self.request.user)
     
     def post(self, request, *args, **kwargs):
-        """Send test email"""
-        email_config = self.get_object()
+        """Queue a test email"""
+        email_config = self.object = self.get_object()
         test_email = request.POST.get('test_email', request.user.email)
         
         try:
-            # Use EmailService to send test email
-            email_service = EmailService()
-            result = email_service.send_test_email(email_config, test_email)
-            
-            if result.get('success'):
-                messages.success(
-                    request,
-                    f'Test email sent successfully to {test_email}!'
-                )
-            else:
-                messages.error(
-                    request,
-                    f'Failed to send test email: {result.get("error", "Unknown error")}'
-                )
-        
-        except Exception as e:
-            logger.error(f"Test email error for {email_config.domain_name}: {str(e)}")
-            messages.error(
+            send_config_test_email.delay(str(email_config.pk), test_email)
+        except QUEUE_ERRORS as e:
+            logger.error(f"Could not queue test email for {email_config.pk}: {str(e)}")
+            messages.error(request, 'The test email could not be queued. Please try again in a few minutes.')
+        else:
+            messages.info(
                 request,
-                'An error occurred while sending the test email. Please check your configuration.'
+                f'A test email is being sent to {test_email}.'
             )
         
         return self.get(request, *args, **kwargs)
@@ -307,34 +309,33 @@ class DomainVerifyAjaxView(View):
     def post(self, request):
         try:
             config_id = request.POST.get('config_id')
-            email_config = get_object_or_404(
-                EmailDomainConfig,
-                id=config_id,
-                user=request.user
-            )
             
-            # Use EmailService to verify domain
-            email_service = EmailService()
-            result = email_service.verify_domain(email_config)
-            
-            if result.get('success'):
-                email_config.domain_verified = True
-                email_config.verification_status = 'VERIFIED'
-                email_config.save()
-                
+            # Ownership check and status change in a single UPDATE
+            updated = EmailDomainConfig.objects.filter(id=config_id, user=request.user).update(
+                verification_status='PENDING',
+                updated_at=timezone.now()
+            )
+            if not updated:
                 return JsonResponse({
-                    'success': True,
-                    'message': 'Domain verified successfully!'
-                })
-            else:
-                email_config.verification_attempts += 1
-                email_config.verification_status = 'FAILED'
-                email_config.save()
-                
+                    'success': False,
+                    'error': 'Email configuration not found'
+                }, status=404)
+            
+            # Verification runs in the background; poll DomainVerifyStatusAjaxView
+            try:
+                verify_email_domain.delay(str(config_id))
+            except QUEUE_ERRORS as e:
+                logger.error(f"Could not queue domain verification for {config_id}: {str(e)}")
                 return JsonResponse({
                     'success': False,
-                    'error': result.get('error', 'Verification failed')
-                })
+                    'error': 'Domain verification could not be queued. Please try again in a few minutes.'
+                }, status=503)
+            
+            return JsonResponse({
+                'success': True,
+                'status': 'pending',
+                'message': 'Domain verification started'
+            })
         
         except Exception as e:
             logger.error(f"AJAX domain verification error: {str(e)}")
@@ -344,6 +345,30 @@ class DomainVerifyAjaxView(View):
             })
 
 
+@method_decorator(login_required, name='dispatch')
+class DomainVerifyStatusAjaxView(View):
+    """AJAX endpoint reporting the result of a queued domain verification"""
+    
+    def get(self, request, pk):
+        email_config = get_object_or_404(
+            EmailDomainConfig.objects.only(
+                'id', 'user', 'domain_verified', 'verification_status', 'last_verification_attempt'
+            ),
+            id=pk,
+            user=request.user
+        )
+        
+        return JsonResponse({
+            'success': True,
+            'status': email_config.verification_status.lower(),
+            'domain_verified': email_config.domain_verified,
+            'last_attempt': (
+                email_config.last_verification_attempt.isoformat()
+                if email_config.last_verification_attempt else None
+            ),
+        })
+
+
 @method_decorator(login_required, name='dispatch')
 class EmailTestAjaxView(View):
     """AJAX endpoint for sending test emails"""
@@ -353,26 +378,26 @@ class EmailTestAjaxView(View):
             config_id = request.POST.get('config_id')
             test_email = request.POST.get('test_email', request.user.email)
             
-            email_config = get_object_or_404(
-                EmailDomainConfig,
-                id=config_id,
-                user=request.user
-            )
-            
-            # Use EmailService to send test email
-            email_service = EmailService()
-            result = email_service.send_test_email(email_config, test_email)
-            
-            if result.get('success'):
+            if not EmailDomainConfig.objects.filter(id=config_id, user=request.user).exists():
                 return JsonResponse({
-                    'success': True,
-                    'message': f'Test email sent to {test_email}!'
-                })
-            else:
+                    'success': False,
+                    'error': 'Email configuration not found'
+                }, status=404)
+            
+            try:
+                send_config_test_email.delay(str(config_id), test_email)
+            except QUEUE_ERRORS as e:
+                logger.error(f"Could not queue test email for {config_id}: {str(e)}")
                 return JsonResponse({
                     'success': False,
-                    'error': result.get('error', 'Failed to send test email')
-                })
+                    'error': 'The test email could not be queued. Please try again in a few minutes.'
+                }, status=503)
+            
+            return JsonResponse({
+                'success': True,
+                'status': 'pending',
+                'message': f'Test email queued for {test_email}'
+            })
         
         except Exception as e:
             logger.error(f"AJAX test email error: {str(e)}")
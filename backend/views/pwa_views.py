@@ -1,313 +1,185 @@
 # backend/views/pwa_views.py
 
-from django.http import JsonResponse, HttpResponse
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
 from django.views.generic import View, TemplateView
 from django.conf import settings
 from django.contrib.staticfiles import finders
+import gzip
+import hashlib
 import json
 import os
-
-
-class ManifestView(View):
-    """PWA manifest.json view"""
-    
-    def get(self, request, *args, **kwargs):
-        manifest = {
-            "name": "AfriMail Pro",
-            "short_name": "AfriMail",
-            "description": "Professional Email Marketing Platform for Africa",
-            "start_url": "/",
-            "scope": "/",
-            "display": "standalone",
-            "orientation": "portrait-primary",
-            "theme_color": "#1f2937",
-            "background_color": "#ffffff",
-            "categories": ["business", "productivity", "communication"],
-            "lang": "en",
-            "dir": "ltr",
+import re
+
+
+MANIFEST = {
+    "name": "AfriMail Pro",
+    "short_name": "AfriMail",
+    "description": "Professional Email Marketing Platform for Africa",
+    "start_url": "/",
+    "scope": "/",
+    "display": "standalone",
+    "orientation": "portrait-primary",
+    "theme_color": "#1f2937",
+    "background_color": "#ffffff",
+    "categories": ["business", "productivity", "communication"],
+    "lang": "en",
+    "dir": "ltr",
+    "icons": [
+        {
+            "src": "/static/icons/icon-72x72.png",
+            "sizes": "72x72",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-96x96.png",
+            "sizes": "96x96",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-128x128.png",
+            "sizes": "128x128",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-144x144.png",
+            "sizes": "144x144",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-152x152.png",
+            "sizes": "152x152",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-192x192.png",
+            "sizes": "192x192",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-384x384.png",
+            "sizes": "384x384",
+            "type": "image/png",
+            "purpose": "any maskable"
+        },
+        {
+            "src": "/static/icons/icon-512x512.png",
+            "sizes": "512x512",
+            "type": "image/png",
+            "purpose": "any maskable"
+        }
+    ],
+    "screenshots": [
+        {
+            "src": "/static/screenshots/desktop-1.png",
+            "sizes": "1280x720",
+            "type": "image/png",
+            "form_factor": "wide"
+        },
+        {
+            "src": "/static/screenshots/mobile-1.png",
+            "sizes": "320x568",
+            "type": "image/png",
+            "form_factor": "narrow"
+        }
+    ],
+    "shortcuts": [
+        {
+            "name": "Dashboard",
+            "short_name": "Dashboard",
+            "description": "View your email marketing dashboard",
+            "url": "/dashboard/",
             "icons": [
                 {
-                    "src": "/static/icons/icon-72x72.png",
-                    "sizes": "72x72",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-96x96.png",
-                    "sizes": "96x96",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-128x128.png",
-                    "sizes": "128x128",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-144x144.png",
-                    "sizes": "144x144",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-152x152.png",
-                    "sizes": "152x152",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-192x192.png",
-                    "sizes": "192x192",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-384x384.png",
-                    "sizes": "384x384",
-                    "type": "image/png",
-                    "purpose": "any maskable"
-                },
-                {
-                    "src": "/static/icons/icon-512x512.png",
-                    "sizes": "512x512",
-                    "type": "image/png",
-                    "purpose": "any maskable"
+                    "src": "/static/icons/shortcut-dashboard.png",
+                    "sizes": "192x192"
                 }
-            ],
-            "screenshots": [
-                {
-                    "src": "/static/screenshots/desktop-1.png",
-                    "sizes": "1280x720",
-                    "type": "image/png",
-                    "form_factor": "wide"
-                },
+            ]
+        },
+        {
+            "name": "Contacts",
+            "short_name": "Contacts",
+            "description": "Manage your contact lists",
+            "url": "/contacts/",
+            "icons": [
                 {
-                    "src": "/static/screenshots/mobile-1.png",
-                    "sizes": "320x568",
-                    "type": "image/png",
-                    "form_factor": "narrow"
+                    "src": "/static/icons/shortcut-contacts.png",
+                    "sizes": "192x192"
                 }
-            ],
-            "shortcuts": [
-                {
-                    "name": "Dashboard",
-                    "short_name": "Dashboard",
-                    "description": "View your email marketing dashboard",
-                    "url": "/dashboard/",
-                    "icons": [
-                        {
-                            "src": "/static/icons/shortcut-dashboard.png",
-                            "sizes": "192x192"
-                        }
-                    ]
-                },
-                {
-                    "name": "Contacts",
-                    "short_name": "Contacts",
-                    "description": "Manage your contact lists",
-                    "url": "/contacts/",
-                    "icons": [
-                        {
-                            "src": "/static/icons/shortcut-contacts.png",
-                            "sizes": "192x192"
-                        }
-                    ]
-                },
+            ]
+        },
+        {
+            "name": "Campaigns",
+            "short_name": "Campaigns",
+            "description": "Create and manage email campaigns",
+            "url": "/campaigns/",
+            "icons": [
                 {
-                    "name": "Campaigns",
-                    "short_name": "Campaigns",
-                    "description": "Create and manage email campaigns",
-                    "url": "/campaigns/",
-                    "icons": [
-                        {
-                            "src": "/static/icons/shortcut-campaigns.png",
-                            "sizes": "192x192"
-                        }
-                    ]
+                    "src": "/static/icons/shortcut-campaigns.png",
+                    "sizes": "192x192"
                 }
-            ],
-            "related_applications": [],
-            "prefer_related_applications": False
+            ]
         }
-        
-        response = JsonResponse(manifest)
-        response['Content-Type'] = 'application/manifest+json'
-        return response
+    ],
+    "related_applications": [],
+    "prefer_related_applications": False
+}
 
+# The manifest never changes at runtime, so it is encoded once at import
+MANIFEST_JSON = json.dumps(MANIFEST, separators=(',', ':')).encode('utf-8')
+MANIFEST_ETAG = hashlib.md5(MANIFEST_JSON).hexdigest()
 
-class ServiceWorkerView(View):
-    """Service worker view"""
-    
-    def get(self, request, *args, **kwargs):
-        service_worker_content = """
-// AfriMail Pro Service Worker
-const CACHE_NAME = 'afrimail-v1.0.0';
-const STATIC_CACHE = 'afrimail-static-v1.0.0';
-const DYNAMIC_CACHE = 'afrimail-dynamic-v1.0.0';
+# The service worker script lives in backend/static/js and is read once at import
+with open(finders.find('js/service-worker.js'), 'rb') as service_worker_file:
+    SERVICE_WORKER_JS = service_worker_file.read()
+SERVICE_WORKER_ETAG = hashlib.md5(SERVICE_WORKER_JS).hexdigest()
+SERVICE_WORKER_GZIP = gzip.compress(SERVICE_WORKER_JS, mtime=0)
 
-// Files to cache immediately
-const STATIC_FILES = [
-    '/',
-    '/static/css/main.css',
-    '/static/js/main.js',
-    '/static/icons/icon-192x192.png',
-    '/static/icons/icon-512x512.png',
-    '/offline/',
-];
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
 
-// Install event
-self.addEventListener('install', event => {
-    console.log('Service Worker: Installing...');
-    event.waitUntil(
-        caches.open(STATIC_CACHE)
-            .then(cache => {
-                console.log('Service Worker: Caching static files');
-                return cache.addAll(STATIC_FILES);
-            })
-            .catch(err => console.log('Service Worker: Cache failed', err))
-    );
-});
 
-// Activate event
-self.addEventListener('activate', event => {
-    console.log('Service Worker: Activating...');
-    event.waitUntil(
-        caches.keys().then(cacheNames => {
-            return Promise.all(
-                cacheNames.map(cache => {
-                    if (cache !== STATIC_CACHE && cache !== DYNAMIC_CACHE) {
-                        console.log('Service Worker: Clearing old cache');
-                        return caches.delete(cache);
-                    }
-                })
-            );
-        })
-    );
-});
+def accepts_gzip(request):
+    """Whether the client accepts gzip-encoded responses"""
+    return bool(ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')))
 
-// Fetch event
-self.addEventListener('fetch', event => {
-    // Skip non-GET requests
-    if (event.request.method !== 'GET') return;
-    
-    // Skip Chrome extension requests
-    if (event.request.url.includes('chrome-extension://')) return;
-    
-    event.respondWith(
-        caches.match(event.request)
-            .then(response => {
-                // Return cached version or fetch from network
-                return response || fetch(event.request)
-                    .then(fetchResponse => {
-                        // Check if we received a valid response
-                        if (!fetchResponse || fetchResponse.status !== 200 || fetchResponse.type !== 'basic') {
-                            return fetchResponse;
-                        }
-                        
-                        // Clone the response for caching
-                        const responseToCache = fetchResponse.clone();
-                        
-                        // Cache dynamic content
-                        caches.open(DYNAMIC_CACHE)
-                            .then(cache => {
-                                cache.put(event.request, responseToCache);
-                            });
-                        
-                        return fetchResponse;
-                    })
-                    .catch(() => {
-                        // Return offline page for navigation requests
-                        if (event.request.mode === 'navigate') {
-                            return caches.match('/offline/');
-                        }
-                        
-                        // Return fallback for images
-                        if (event.request.destination === 'image') {
-                            return caches.match('/static/icons/icon-192x192.png');
-                        }
-                    });
-            })
-    );
-});
 
-// Background sync for offline actions
-self.addEventListener('sync', event => {
-    console.log('Service Worker: Background sync', event.tag);
-    
-    if (event.tag === 'background-sync') {
-        event.waitUntil(doBackgroundSync());
-    }
-});
+def service_worker_etag(request, *args, **kwargs):
+    """ETag of the service worker body the request will receive"""
+    return f'{SERVICE_WORKER_ETAG}-gzip' if accepts_gzip(request) else SERVICE_WORKER_ETAG
 
-function doBackgroundSync() {
-    // Handle offline actions when back online
-    return fetch('/api/sync/')
-        .then(response => response.json())
-        .then(data => {
-            console.log('Background sync completed', data);
-        })
-        .catch(err => {
-            console.log('Background sync failed', err);
-        });
-}
 
-// Push notifications
-self.addEventListener('push', event => {
-    console.log('Service Worker: Push received', event);
-    
-    const options = {
-        body: event.data ? event.data.text() : 'New notification from AfriMail Pro',
-        icon: '/static/icons/icon-192x192.png',
-        badge: '/static/icons/badge-72x72.png',
-        vibrate: [100, 50, 100],
-        data: {
-            dateOfArrival: Date.now(),
-            primaryKey: 1
-        },
-        actions: [
-            {
-                action: 'explore',
-                title: 'View',
-                icon: '/static/icons/action-view.png'
-            },
-            {
-                action: 'close',
-                title: 'Close',
-                icon: '/static/icons/action-close.png'
-            }
-        ]
-    };
+@method_decorator(condition(etag_func=lambda request, *args, **kwargs: MANIFEST_ETAG), name='get')
+class ManifestView(View):
+    """PWA manifest.json view"""
     
-    event.waitUntil(
-        self.registration.showNotification('AfriMail Pro', options)
-    );
-});
+    def get(self, request, *args, **kwargs):
+        response = HttpResponse(MANIFEST_JSON, content_type='application/manifest+json')
+        response['Cache-Control'] = 'public, max-age=86400, immutable'
+        return response
 
-// Notification click
-self.addEventListener('notificationclick', event => {
-    console.log('Service Worker: Notification clicked', event);
-    event.notification.close();
-    
-    if (event.action === 'explore') {
-        event.waitUntil(
-            clients.openWindow('/')
-        );
-    }
-});
 
-// Message from main thread
-self.addEventListener('message', event => {
-    console.log('Service Worker: Message received', event.data);
+@method_decorator(condition(etag_func=service_worker_etag), name='get')
+class ServiceWorkerView(View):
+    """Service worker view"""
     
-    if (event.data && event.data.type === 'SKIP_WAITING') {
-        self.skipWaiting();
-    }
-});
-"""
-        
-        response = HttpResponse(service_worker_content, content_type='application/javascript')
+    def get(self, request, *args, **kwargs):
+        # Browsers must revalidate the worker so updates are picked up; the ETag makes that a 304
+        if accepts_gzip(request):
+            response = HttpResponse(SERVICE_WORKER_GZIP, content_type='application/javascript')
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(SERVICE_WORKER_JS, content_type='application/javascript')
+        response['Cache-Control'] = 'max-age=0, must-revalidate'
         response['Service-Worker-Allowed'] = '/'
+        patch_vary_headers(response, ('Accept-Encoding',))
         return response
 
 